@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pathlib import Path
 from typing import Callable, Optional, Sequence, Tuple
 
 import matplotlib.animation
@@ -23,6 +24,10 @@ import jumanji.environments
 from jumanji.environments.packing.knapsack.types import State
 from jumanji.viewer import Viewer
 
+# Static background image, resolved relative to the package so that rendering
+# does not depend on the current working directory.
+_MAP_IMG_PATH = Path(__file__).resolve().parents[4] / "docs" / "img" / "knapsack.png"
+
 
 class KnapsackViewer(Viewer):
     FIGURE_SIZE = (5.0, 5.0)
@@ -42,6 +47,10 @@ class KnapsackViewer(Viewer):
         self._name = name
         self._total_budget = total_budget
 
+        # The background image is static: it is loaded on the first render and
+        # cached, so constructing the environment never touches the file.
+        self._map_img: Optional[NDArray] = None
+
         # The animation must be stored in a variable that lives as long as the
         # animation should run. Otherwise, the animation will get garbage-collected.
         self._animation: Optional[matplotlib.animation.Animation] = None
@@ -142,8 +151,9 @@ class KnapsackViewer(Viewer):
         ax.set_ylim(0, 1)
         ax.get_xaxis().set_visible(False)
         ax.get_yaxis().set_visible(False)
-        map_img = plt.imread("docs/img/knapsack.png")
-        ax.imshow(map_img, extent=[0, 1, 0, 1])
+        if self._map_img is None:
+            self._map_img = plt.imread(_MAP_IMG_PATH)
+        ax.imshow(self._map_img, extent=[0, 1, 0, 1])
 
     def _display_human(self, fig: plt.Figure) -> None:
         if plt.isinteractive():
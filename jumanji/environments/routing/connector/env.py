@@ -34,6 +34,7 @@ from jumanji.environments.routing.connector.generator import (
 from jumanji.environments.routing.connector.reward import DenseRewardFn, RewardFn
 from jumanji.environments.routing.connector.types import Agent, Observation, State
 from jumanji.environments.routing.connector.utils import (
+    MOVE_OFFSETS,
     connected_or_blocked,
     get_agent_grid,
     get_correction_mask,
@@ -57,7 +58,7 @@ class Connector(Environment[State]):
         - action mask: jax array (bool) of shape (num_agents, 5).
         - step_count: jax array (int32) of shape ()
             the current episode step.
-        - grid: jax array (int32) of shape (num_agents, size, size)
+        - grid: jax array (int16) of shape (num_agents, size, size)
             - each 2d array (size, size) along axis 0 is the agent's local observation.
             - agents have ids from 0 to (num_agents - 1)
             - with 2 agents you might have a grid like this:
@@ -85,7 +86,7 @@ class Connector(Environment[State]):
 
     - state: State:
         - key: jax PRNG key used to randomly spawn agents and targets.
-        - grid: jax array (int32) of shape (size, size) which corresponds to agent 0's observation.
+        - grid: jax array (int16) of shape (size, size) which corresponds to agent 0's observation.
         - step_count: jax array (int32) of shape () number of steps elapsed in the current episode.
 
     ```python
@@ -126,10 +127,38 @@ class Connector(Environment[State]):
         self.time_limit = time_limit
         self.num_agents = self._generator.num_agents
         self.grid_size = self._generator.grid_size
-        self._agent_ids = jnp.arange(self.num_agents)
         self._viewer = viewer or ConnectorViewer(
             "Connector", self.num_agents, render_mode="human"
         )
+        # switch_perspective is an elementwise relabelling of cell values, so
+        # precompute it as a (num_agents, num_values) lookup table and turn the
+        # per-agent observation into a single gather.
+        cell_values = jnp.arange(
+            self.num_agents * 3 + AGENT_INITIAL_VALUE + 1, dtype=jnp.int16
+        )
+        self._perspective_lut = jax.vmap(switch_perspective, (None, 0, None))(
+            cell_values, jnp.arange(self.num_agents), self.num_agents
+        ).astype(cell_values.dtype)
+        # Specs only depend on construction arguments, build them lazily once
+        # and reuse them on subsequent calls.
+        self._observation_spec: Optional[specs.Spec[Observation]] = None
+        self._action_spec: Optional[specs.MultiDiscreteArray] = None
+        self._reward_spec: Optional[specs.Array] = None
+        self._discount_spec: Optional[specs.BoundedArray] = None
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            type(self) is type(other)
+            and self._generator == other._generator  # type: ignore[attr-defined]
+            and self._reward_fn == other._reward_fn  # type: ignore[attr-defined]
+            and self.time_limit == other.time_limit  # type: ignore[attr-defined]
+        )
+
+    def __hash__(self) -> int:
+        # Hash on configuration so environments with the same construction
+        # arguments can share jit caches, e.g. when `self` is a static
+        # argument of a jitted step function across sweep workers.
+        return hash((type(self), self._generator, self._reward_fn, self.time_limit))
 
     def reset(self, key: chex.PRNGKey) -> Tuple[State, TimeStep[Observation]]:
         """Resets the environment.
@@ -143,9 +172,7 @@ class Connector(Environment[State]):
         """
         state = self._generator(key)
 
-        action_mask = jax.vmap(self._get_action_mask, (0, None))(
-            state.agents, state.grid
-        )
+        action_mask = self._get_action_mask(state.agents, state.grid)
         observation = Observation(
             grid=self._obs_from_grid(state.grid),
             action_mask=action_mask,
@@ -183,7 +210,7 @@ class Connector(Environment[State]):
         # Construct timestep: get observations, rewards, discounts
         grids = self._obs_from_grid(grid)
         reward = self._reward_fn(state, action, new_state)
-        action_mask = jax.vmap(self._get_action_mask, (0, None))(agents, grid)
+        action_mask = self._get_action_mask(agents, grid)
         observation = Observation(
             grid=grids, action_mask=action_mask, step_count=new_state.step_count
         )
@@ -247,8 +274,10 @@ class Connector(Environment[State]):
                 lambda: new_agent,
             )
         )(collided_agents, state.agents, agents)
-        # Create the new grid by fixing old one with correction mask and adding the obstacles
-        return agents, joined_grid + correction_mask
+        # Create the new grid by fixing old one with correction mask and adding the obstacles.
+        # The join/correction arithmetic widens to int32, cast back so the grid
+        # keeps its narrow dtype across steps.
+        return agents, (joined_grid + correction_mask).astype(state.grid.dtype)
 
     def _step_agent(
         self, agent: Agent, grid: chex.Array, action: chex.Numeric
@@ -273,22 +302,25 @@ class Connector(Environment[State]):
 
     def _obs_from_grid(self, grid: chex.Array) -> chex.Array:
         """Gets the observation vector for all agents."""
-        return jax.vmap(switch_perspective, (None, 0, None))(
-            grid, self._agent_ids, self.num_agents
+        return self._perspective_lut[:, grid]
+
+    def _get_action_mask(self, agents: Agent, grid: chex.Array) -> chex.Array:
+        """Gets the action mask of every agent."""
+        # Compute the candidate positions for all agents and all 4 moves with
+        # one broadcasted add, then validate them with a single vmap over the
+        # flattened (num_agents * 4) batch: one flat vmap lowers to a shallower
+        # program than a per-agent vmap nested inside a per-action one.
+        candidates = (agents.position[:, None, :] + MOVE_OFFSETS[1:]).reshape(-1, 2)
+        flat_agents = jax.tree_util.tree_map(
+            lambda x: jnp.repeat(x, 4, axis=0), agents
+        )
+        valid = jax.vmap(is_valid_position, in_axes=(None, 0, 0))(
+            grid, flat_agents, candidates
+        ).reshape(self.num_agents, 4)
+        # Don't check action 0 because no-op is always valid.
+        return jnp.concatenate(
+            [jnp.ones((self.num_agents, 1), dtype=bool), valid], axis=1
         )
-
-    def _get_action_mask(self, agent: Agent, grid: chex.Array) -> chex.Array:
-        """Gets an agent's action mask."""
-        # Don't check action 0 because no-op is always valid
-        actions = jnp.arange(1, 5)
-
-        def is_valid_action(action: int) -> chex.Array:
-            agent_pos = move_position(agent.position, action)
-            return is_valid_position(grid, agent, agent_pos)
-
-        mask = jnp.ones(5, dtype=bool)
-        mask = mask.at[actions].set(jax.vmap(is_valid_action)(actions))
-        return mask
 
     def _get_extras(self, state: State) -> Dict:
         """Computes extras metrics to be return within the timestep."""
@@ -344,13 +376,15 @@ class Connector(Environment[State]):
 
         Returns:
             Spec for the `Observation` whose fields are:
-            - grid: BoundedArray (int32) of shape (num_agents, grid_size, grid_size).
+            - grid: BoundedArray (int16) of shape (num_agents, grid_size, grid_size).
             - action_mask: BoundedArray (bool) of shape (num_agents, 5).
             - step_count: BoundedArray (int32) of shape ().
         """
+        if self._observation_spec is not None:
+            return self._observation_spec
         grid = specs.BoundedArray(
             shape=(self.num_agents, self.grid_size, self.grid_size),
-            dtype=jnp.int32,
+            dtype=jnp.int16,
             name="grid",
             minimum=0,
             maximum=self.num_agents * 3 + AGENT_INITIAL_VALUE,
@@ -369,13 +403,14 @@ class Connector(Environment[State]):
             maximum=self.time_limit,
             name="step_count",
         )
-        return specs.Spec(
+        self._observation_spec = specs.Spec(
             Observation,
             "ObservationSpec",
             grid=grid,
             action_mask=action_mask,
             step_count=step_count,
         )
+        return self._observation_spec
 
     def action_spec(self) -> specs.MultiDiscreteArray:
         """Returns the action spec for the Connector environment.
@@ -386,28 +421,36 @@ class Connector(Environment[State]):
         Returns:
             observation_spec: `MultiDiscreteArray` of shape (num_agents,).
         """
-        return specs.MultiDiscreteArray(
-            num_values=jnp.array([5] * self.num_agents),
-            dtype=jnp.int32,
-            name="action",
-        )
+        if self._action_spec is None:
+            self._action_spec = specs.MultiDiscreteArray(
+                num_values=jnp.array([5] * self.num_agents),
+                dtype=jnp.int32,
+                name="action",
+            )
+        return self._action_spec
 
     def reward_spec(self) -> specs.Array:
         """
         Returns:
             reward_spec: a `specs.Array` spec of shape (num_agents,). One for each agent.
         """
-        return specs.Array(shape=(self.num_agents,), dtype=float, name="reward")
+        if self._reward_spec is None:
+            self._reward_spec = specs.Array(
+                shape=(self.num_agents,), dtype=float, name="reward"
+            )
+        return self._reward_spec
 
     def discount_spec(self) -> specs.BoundedArray:
         """
         Returns:
             discount_spec: a `specs.Array` spec of shape (num_agents,). One for each agent
         """
-        return specs.BoundedArray(
-            shape=(self.num_agents,),
-            dtype=float,
-            minimum=0.0,
-            maximum=1.0,
-            name="discount",
-        )
+        if self._discount_spec is None:
+            self._discount_spec = specs.BoundedArray(
+                shape=(self.num_agents,),
+                dtype=float,
+                minimum=0.0,
+                maximum=1.0,
+                name="discount",
+            )
+        return self._discount_spec
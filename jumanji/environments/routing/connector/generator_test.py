@@ -40,8 +40,9 @@ def test_uniform_random_generator__call(
     # and the starts and ends point to the correct heads and targets, respectively
     agents_on_grid = state.grid[jax.vmap(tuple)(state.agents.position)]
     targets_on_grid = state.grid[jax.vmap(tuple)(state.agents.target)]
-    assert (agents_on_grid == jnp.array([get_position(i) for i in range(3)])).all()
-    assert (targets_on_grid == jnp.array([get_target(i) for i in range(3)])).all()
+    agent_ids = jnp.arange(3)
+    assert (agents_on_grid == jax.vmap(get_position)(agent_ids)).all()
+    assert (targets_on_grid == jax.vmap(get_target)(agent_ids)).all()
 
 
 def test_uniform_random_generator__no_retrace(
@@ -61,6 +61,16 @@ class DenseRewardFn(RewardFn):
         self.timestep_reward = timestep_reward
         self.connected_reward = connected_reward
 
+    def __eq__(self, other: object) -> bool:
+        return (
+            type(self) is type(other)
+            and self.connected_reward == other.connected_reward  # type: ignore[attr-defined]
+            and self.timestep_reward == other.timestep_reward  # type: ignore[attr-defined]
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.connected_reward, self.timestep_reward))
+
     def __call__(
         self,
         state: State,
@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import chex
 import matplotlib.animation
 import matplotlib.cm
+import matplotlib.collections
 import matplotlib.pyplot as plt
 import numpy as np
 from numpy.typing import NDArray
@@ -54,13 +55,13 @@ class ConnectorViewer(Viewer):
         else:
             raise ValueError(f"Invalid render mode: {render_mode}")
 
-        # Pick colors.
+        # Pick colors. Store them as one contiguous array so per-cell lookups
+        # index into it directly instead of unpacking Python tuples.
         colormap_indecies = np.arange(0, 1, 1 / num_agents)
         colormap = matplotlib.cm.get_cmap("hsv", num_agents + 1)
 
-        self.colors = [(1.0, 1.0, 1.0, 1.0)]  # Initial color must be white.
-        for colormap_idx in colormap_indecies:
-            self.colors.append(colormap(colormap_idx))
+        self.colors = np.ones((num_agents + 1, 4))  # Initial color must be white.
+        self.colors[1:] = colormap(colormap_indecies)
 
         # The animation must be stored in a variable that lives as long as the
         # animation should run. Otherwise, the animation will get garbage-collected.
@@ -144,25 +145,40 @@ class ConnectorViewer(Viewer):
         ax.autoscale_view()
 
     def _draw_grid(self, grid: chex.Array, ax: plt.Axes) -> None:
+        # Sync the grid to host memory once, rather than doing one device
+        # read per cell below.
+        grid = np.asarray(grid)
         rows, cols = grid.shape
 
-        for row in range(rows):
-            for col in range(cols):
-                self._draw_grid_cell(grid[row, col], row, col, ax)
+        # Adding each cell as its own artist makes matplotlib the bottleneck for
+        # large grids, so gather all the cells into a single collection instead.
+        cells = [
+            self._make_grid_cell(grid[row, col], row, col)
+            for row in range(rows)
+            for col in range(cols)
+        ]
+        ax.add_collection(
+            matplotlib.collections.PatchCollection(
+                [cell for cells_in_pos in cells for cell in cells_in_pos],
+                match_original=True,
+            )
+        )
 
-    def _draw_grid_cell(
-        self, cell_value: int, row: int, col: int, ax: plt.Axes
-    ) -> None:
-        cell = plt.Rectangle((col, row), 1, 1, **self._get_cell_attributes(cell_value))
-        ax.add_patch(cell)
+    def _make_grid_cell(
+        self, cell_value: int, row: int, col: int
+    ) -> List[plt.Rectangle]:
+        cells = [
+            plt.Rectangle((col, row), 1, 1, **self._get_cell_attributes(cell_value))
+        ]
 
         if is_target(cell_value):
             pos = (col + 0.25, row + 0.25)
             size = 0.5
             attribs = self._get_inner_cell_attributes(cell_value)
 
-            cell = plt.Rectangle(pos, size, size, **attribs)
-            ax.add_patch(cell)
+            cells.append(plt.Rectangle(pos, size, size, **attribs))
+
+        return cells
 
     def _get_cell_attributes(self, cell_value: int) -> Dict[str, Any]:
         agent_id = get_agent_id(cell_value)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from itertools import groupby
+from pathlib import Path
 from typing import Callable, Optional, Sequence, Tuple
 
 import matplotlib.animation
@@ -25,6 +26,10 @@ import jumanji.environments
 from jumanji.environments.routing.cvrp.types import State
 from jumanji.viewer import Viewer
 
+# Static background image, resolved relative to the package so that rendering
+# does not depend on the current working directory.
+_MAP_IMG_PATH = Path(__file__).resolve().parents[4] / "docs" / "img" / "city_map.jpeg"
+
 
 class CVRPViewer(Viewer):
     FIGURE_SIZE = (10.0, 10.0)
@@ -49,6 +54,10 @@ class CVRPViewer(Viewer):
         # Each route to and from depot has a different color
         self._cmap = matplotlib.cm.get_cmap(self.COLORMAP_NAME, self._num_cities)
 
+        # The map image is static: it is loaded on the first render and
+        # cached, so constructing the environment never touches the file.
+        self._map_img: Optional[NDArray] = None
+
         # The animation must be stored in a variable that lives as long as the
         # animation should run. Otherwise, the animation will get garbage-collected.
         self._animation: Optional[matplotlib.animation.Animation] = None
@@ -142,8 +151,9 @@ class CVRPViewer(Viewer):
         ax.set_ylim(0, 1)
         ax.get_xaxis().set_visible(False)
         ax.get_yaxis().set_visible(False)
-        map_img = plt.imread("docs/img/city_map.jpeg")
-        ax.imshow(map_img, extent=[0, 1, 0, 1])
+        if self._map_img is None:
+            self._map_img = plt.imread(_MAP_IMG_PATH)
+        ax.imshow(self._map_img, extent=[0, 1, 0, 1])
 
     def _group_tour(self, tour: Array) -> list:
         """Group the tour into routes that either (1) start and end at the depot, or, (2) start at
@@ -26,7 +26,7 @@ from jumanji.environments.routing.maze.constants import MOVES
 from jumanji.environments.routing.maze.generator import Generator, RandomGenerator
 from jumanji.environments.routing.maze.types import Observation, Position, State
 from jumanji.environments.routing.maze.viewer import MazeEnvViewer
-from jumanji.types import TimeStep, restart, termination, transition
+from jumanji.types import StepType, TimeStep, restart
 from jumanji.viewer import Viewer
 
 
@@ -278,13 +278,14 @@ class Maze(Environment[State]):
         # Compute the reward.
         reward = jnp.array(state.agent_position == state.target_position, float)
 
-        # Return either a MID or a LAST timestep depending on done.
-        timestep = jax.lax.cond(
-            done,
-            termination,
-            transition,
-            reward,
-            observation,
+        # Return either a MID or a LAST timestep depending on done. The two
+        # branches only differ in step_type and discount, so selecting those
+        # two scalars with `where` avoids tracing both branches of a `cond`.
+        timestep = TimeStep(
+            step_type=jnp.where(done, StepType.LAST, StepType.MID),
+            reward=reward,
+            discount=jnp.where(done, jnp.array(0, float), jnp.array(1, float)),
+            observation=observation,
         )
         return state, timestep
 
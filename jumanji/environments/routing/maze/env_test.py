@@ -181,16 +181,23 @@ class TestMazeEnvironment:
             step_count=jnp.array(0, jnp.int32),
         )
 
-        actions = [1, 1, 0, 0, 0, 0]
+        assert timestep.reward == 0
 
-        for a in actions:
-            assert timestep.reward == 0
-            assert timestep.step_type < StepType.LAST
-            state, timestep = maze.step(state, a)
+        actions = jnp.array([1, 1, 0, 0, 0, 0], jnp.int32)
+
+        # Roll out the whole episode in a single compiled scan, which also
+        # checks that step is scan-friendly.
+        state, timesteps = jax.jit(
+            lambda s: jax.lax.scan(maze.step, s, actions)
+        )(state)
+
+        # No reward or termination until the target is reached.
+        assert jnp.all(timesteps.reward[:-1] == 0)
+        assert jnp.all(timesteps.step_type[:-1] < StepType.LAST)
 
         # Final step into the target
-        assert timestep.reward == 1
-        assert timestep.last()
+        assert timesteps.reward[-1] == 1
+        assert timesteps.last()[-1]
         assert state.agent_position == state.target_position
 
     def test_maze__toy_generator(self) -> None:
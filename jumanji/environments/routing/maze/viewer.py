@@ -16,6 +16,7 @@ from typing import Optional, Sequence
 
 import chex
 import matplotlib
+import numpy as np
 from numpy.typing import NDArray
 
 from jumanji.environments.commons.maze_utils.maze_rendering import MazeViewer
@@ -82,6 +83,9 @@ class MazeEnvViewer(MazeViewer):
         return super().animate(mazes, interval, save_path)
 
     def _overlay_agent_and_target(self, state: State) -> chex.Array:
-        maze = state.walls.astype(int)
-        maze = maze.at[tuple(state.agent_position)].set(self.AGENT)
-        return maze.at[tuple(state.target_position)].set(self.TARGET)
+        # Rendering is host-only, so copy the walls to a numpy array once and
+        # overlay with plain writes rather than dispatching device scatters.
+        maze = np.asarray(state.walls, dtype=np.int32).copy()
+        maze[tuple(np.asarray(state.agent_position))] = self.AGENT
+        maze[tuple(np.asarray(state.target_position))] = self.TARGET
+        return maze
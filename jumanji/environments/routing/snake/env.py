@@ -20,6 +20,7 @@ import jax.numpy as jnp
 import matplotlib
 import matplotlib.animation
 import matplotlib.artist
+import matplotlib.collections
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle, Rectangle
 
@@ -460,12 +461,19 @@ class Snake(Environment[State]):
             ax.add_patch(patch)
 
     def _draw_board(self, ax: plt.Axes) -> None:
-        # Draw the square box that delimits the board.
+        # Draw the square box that delimits the board as a single artist rather
+        # than one Line2D per side.
         ax.axis("off")
-        ax.plot([0, 0], [0, self.num_rows], "-k", lw=2)
-        ax.plot([0, self.num_cols], [self.num_rows, self.num_rows], "-k", lw=2)
-        ax.plot([self.num_cols, self.num_cols], [self.num_rows, 0], "-k", lw=2)
-        ax.plot([self.num_cols, 0], [0, 0], "-k", lw=2)
+        segments = [
+            [(0, 0), (0, self.num_rows)],
+            [(0, self.num_rows), (self.num_cols, self.num_rows)],
+            [(self.num_cols, self.num_rows), (self.num_cols, 0)],
+            [(self.num_cols, 0), (0, 0)],
+        ]
+        ax.add_collection(
+            matplotlib.collections.LineCollection(segments, colors="k", linewidths=2)
+        )
+        ax.autoscale_view()
 
     def _create_entities(self, state: State) -> List[matplotlib.patches.Patch]:
         """Loop over the different cells and draws corresponding shapes in the ax object."""
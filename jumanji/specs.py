@@ -16,7 +16,10 @@ import abc
 import copy
 import functools
 import inspect
+import operator
+import os
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -31,17 +34,78 @@ from typing import (
 )
 
 import chex
-import dm_env.specs
-import gym
 import jax
 import jax.numpy as jnp
 import numpy as np
 
+if TYPE_CHECKING:
+    # gym and dm_env are only needed by the spec converters below; importing
+    # them lazily keeps them off the critical `import jumanji` path for pure
+    # jax training loops.
+    import dm_env.specs
+    import gym
+
 from jumanji.testing.pytrees import is_equal_pytree
 from jumanji.types import get_valid_dtype
 
 T = TypeVar("T")
 
+# Spec validation is a debugging aid: it checks every value handed to or
+# returned by an environment, which is pure overhead once an environment is
+# trusted. Setting the `JUMANJI_DISABLE_SPEC_CHECKS` environment variable to
+# any non-empty value turns all `validate` methods into identity
+# pass-throughs, removing the per-step shape/dtype/bounds checks.
+_DISABLE_SPEC_CHECKS = bool(os.environ.get("JUMANJI_DISABLE_SPEC_CHECKS"))
+
+# Integer dtypes accepted by the discrete specs. A frozenset membership test
+# is an O(1) hash lookup, where `jnp.issubdtype` walks the dtype hierarchy.
+_INTEGER_DTYPES = frozenset(
+    np.dtype(t)
+    for t in (
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+    )
+)
+
+
+def _as_array(x: Union[chex.Numeric, Sequence], dtype: jnp.dtype) -> chex.Array:
+    """Returns `x` unchanged when it is already a jax array of `dtype`, skipping
+    the `jnp.asarray` dispatch, and converts otherwise."""
+    if isinstance(x, jnp.ndarray) and x.dtype == dtype:
+        return x
+    return jnp.asarray(x, dtype)
+
+
+@jax.jit
+def _out_of_bounds(
+    value: chex.Array, minimum: chex.Array, maximum: chex.Array
+) -> chex.Array:
+    """Returns whether any element of `value` lies outside `[minimum, maximum]`.
+
+    Jitted so that both comparisons and the reduction fuse into a single
+    kernel with one dispatch, rather than two masks and two `.any()` syncs
+    per call. The compiled version is cached per value/bounds shape.
+    """
+    return ((value < minimum) | (value > maximum)).any()
+
+
+@jax.jit
+def _out_of_bounds_scalar(
+    value: chex.Array, minimum: chex.Array, maximum: chex.Array
+) -> chex.Array:
+    """Bounds check specialized to scalar `minimum`/`maximum`.
+
+    Reduces `value` to its extrema and compares those two scalars against the
+    bounds, one reduction pass instead of two elementwise masks.
+    """
+    return (value.min() < minimum) | (value.max() > maximum)
+
 
 class Spec(abc.ABC, Generic[T]):
     """Adapted from `dm_env.spec.Array`. This is an augmentation of the `Array` spec to allow for nested
@@ -155,8 +219,15 @@ class Array(Spec[chex.Array]):
         """
         self._constructor = lambda: jnp.zeros(shape, dtype)
         super().__init__(constructor=self._constructor, name=name)
-        self._shape = tuple(int(dim) for dim in shape)
+        # Most callers pass a tuple of ints already; reuse it rather than
+        # re-boxing every dim. `operator.index` coerces numpy integer scalars
+        # while rejecting floats, unlike `int`.
+        if type(shape) is tuple and all(type(dim) is int for dim in shape):
+            self._shape = shape
+        else:
+            self._shape = tuple(map(operator.index, shape))
         self._dtype = get_valid_dtype(dtype)
+        self._hash = hash((self._shape, self._dtype, self._name))
 
     def __repr__(self) -> str:
         return f"Array(shape={repr(self.shape)}, dtype={repr(self.dtype)}, name={repr(self.name)})"
@@ -194,6 +265,14 @@ class Array(Spec[chex.Array]):
         Raises:
             ValueError: if value doesn't conform to this spec.
         """
+        # Fast path: a jax array that already conforms is returned as is,
+        # without paying for `jnp.asarray` re-wrapping.
+        if (
+            isinstance(value, jnp.ndarray)
+            and value.shape == self._shape
+            and value.dtype == self._dtype
+        ):
+            return value
         value = jnp.asarray(value)
         if value.shape != self.shape:
             self._fail_validation(
@@ -205,12 +284,14 @@ class Array(Spec[chex.Array]):
             )
         return value
 
-    def _get_constructor_kwargs(self) -> Dict[str, Any]:
-        """Returns constructor kwargs for instantiating a new copy of this spec."""
-        # Get the names and kinds of the constructor parameters.
-        params = inspect.signature(
-            functools.partial(type(self).__init__, self)
-        ).parameters
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_constructor_parameter_names(cls) -> Tuple[str, ...]:
+        """Returns the parameter names of `cls.__init__`, inspected once per class.
+
+        `inspect.signature` is slow, and its result only depends on the class.
+        """
+        params = inspect.signature(cls.__init__).parameters
         # __init__ must not accept *args or **kwargs, since otherwise we won't be
         # able to infer what the corresponding attribute names are.
         kinds = {value.kind for value in params.values()}
@@ -218,9 +299,16 @@ class Array(Spec[chex.Array]):
             raise TypeError("specs.Array subclasses must not accept *args.")
         elif inspect.Parameter.VAR_KEYWORD in kinds:
             raise TypeError("specs.Array subclasses must not accept **kwargs.")
+        return tuple(name for name in params if name != "self")
+
+    def _get_constructor_kwargs(self) -> Dict[str, Any]:
+        """Returns constructor kwargs for instantiating a new copy of this spec."""
         # Note that we assume direct correspondence between the names of constructor
         # arguments and attributes.
-        return {name: getattr(self, name) for name in params.keys()}
+        return {
+            name: getattr(self, name)
+            for name in self._get_constructor_parameter_names()
+        }
 
     def replace(self, **kwargs: Any) -> "Array":
         """Returns a new copy of `self` with specified attributes replaced.
@@ -244,6 +332,13 @@ class Array(Spec[chex.Array]):
             and (self.name == other.name)
         )
 
+    def __hash__(self) -> int:
+        # Equal specs always agree on shape, dtype and name — including
+        # subclasses, whose __eq__ compares additional fields — so this hash,
+        # precomputed at construction, is consistent with every __eq__ in the
+        # hierarchy and allows specs to key dicts and caches.
+        return self._hash
+
 
 class BoundedArray(Array):
     """Bounded array spec that specifies minimum and maximum values for an environment. This is
@@ -301,22 +396,28 @@ class BoundedArray(Array):
                 dtype.
         """
         super().__init__(shape, dtype, name)
-        minimum = jnp.asarray(minimum, dtype)
-        maximum = jnp.asarray(maximum, dtype)
+        # Checking broadcast compatibility only needs shape arithmetic, not
+        # materialized shape-sized arrays; fail fast before converting the
+        # bounds to device arrays. The bounds must broadcast *to* `shape`, not
+        # merely with it, e.g. a (3,) bound is incompatible with shape (3, 1).
         try:
-            bcast_minimum = jnp.broadcast_to(minimum, shape=shape)
-        except ValueError as jnp_exception:
-            raise ValueError(
-                "`minimum` is incompatible with `shape`"
-            ) from jnp_exception
+            minimum_shape = np.broadcast_shapes(np.shape(minimum), self._shape)
+        except ValueError as np_exception:
+            raise ValueError("`minimum` is incompatible with `shape`") from np_exception
+        if minimum_shape != self._shape:
+            raise ValueError("`minimum` is incompatible with `shape`")
         try:
-            bcast_maximum = jnp.broadcast_to(maximum, shape=shape)
-        except ValueError as jnp_exception:
-            raise ValueError(
-                "`maximum` is incompatible with `shape`"
-            ) from jnp_exception
-
-        if jnp.any(bcast_minimum > bcast_maximum):
+            maximum_shape = np.broadcast_shapes(np.shape(maximum), self._shape)
+        except ValueError as np_exception:
+            raise ValueError("`maximum` is incompatible with `shape`") from np_exception
+        if maximum_shape != self._shape:
+            raise ValueError("`maximum` is incompatible with `shape`")
+        minimum = _as_array(minimum, self._dtype)
+        maximum = _as_array(maximum, self._dtype)
+
+        # Comparing the bounds directly broadcasts them against each other,
+        # which is never larger than broadcasting each out to `shape` first.
+        if jnp.any(minimum > maximum):
             raise ValueError(
                 f"All values in `minimum` must be less than or equal to their corresponding "
                 f"value in `maximum`, got: \n\tminimum={repr(minimum)}\n\tmaximum={repr(maximum)}"
@@ -324,6 +425,9 @@ class BoundedArray(Array):
         self._constructor = lambda: jnp.full(shape, minimum, dtype)
         self._minimum = minimum
         self._maximum = maximum
+        # Scalar bounds allow validation via a min/max reduction of the value
+        # rather than elementwise comparison masks.
+        self._scalar_bounds = minimum.ndim == 0 and maximum.ndim == 0
 
     def __repr__(self) -> str:
         return (
@@ -351,9 +455,23 @@ class BoundedArray(Array):
         """Returns a Jax array specifying the maximum bounds (inclusive)."""
         return self._maximum
 
+    @functools.cached_property
+    def _np_minimum(self) -> np.ndarray:
+        """Host-side copy of `minimum` broadcast to `shape`, transferred once."""
+        return np.broadcast_to(np.asarray(self._minimum), shape=self._shape)
+
+    @functools.cached_property
+    def _np_maximum(self) -> np.ndarray:
+        """Host-side copy of `maximum` broadcast to `shape`, transferred once."""
+        return np.broadcast_to(np.asarray(self._maximum), shape=self._shape)
+
     def validate(self, value: chex.Numeric) -> chex.Array:
         value = super().validate(value)
-        if (value < self.minimum).any() or (value > self.maximum).any():
+        if self._scalar_bounds:
+            out_of_bounds = _out_of_bounds_scalar(value, self.minimum, self.maximum)
+        else:
+            out_of_bounds = _out_of_bounds(value, self.minimum, self.maximum)
+        if out_of_bounds:
             self._fail_validation(
                 "Values were not all within bounds "
                 f"{repr(self.minimum)} <= {repr(value)} <= {repr(self.maximum)}"
@@ -371,6 +489,9 @@ class BoundedArray(Array):
             and (self.name == other.name)
         )
 
+    # Defining __eq__ resets __hash__; restore the shared spec hash.
+    __hash__ = Array.__hash__
+
 
 class DiscreteArray(BoundedArray):
     """Represents a discrete, scalar, zero-based space. This is adapted from
@@ -397,12 +518,16 @@ class DiscreteArray(BoundedArray):
         Raises:
             ValueError: if `num_values` is not positive, if `dtype` is not integer.
         """
-        if num_values <= 0 or not jnp.issubdtype(type(num_values), jnp.integer):
+        if (
+            not isinstance(num_values, (int, np.integer))
+            or isinstance(num_values, bool)
+            or num_values <= 0
+        ):
             raise ValueError(
                 f"`num_values` must be a positive integer, got {num_values}."
             )
 
-        if not jnp.issubdtype(dtype, jnp.integer):
+        if np.dtype(dtype) not in _INTEGER_DTYPES:
             raise ValueError(f"`dtype` must be integer, got {dtype}.")
 
         num_values = int(num_values)
@@ -435,6 +560,8 @@ class DiscreteArray(BoundedArray):
             and (self.name == other.name)
         )
 
+    __hash__ = Array.__hash__
+
 
 class MultiDiscreteArray(BoundedArray):
     """Generalizes DiscreteArray to a multi-dimensional array (e.g. a vector of actions) similarly
@@ -458,12 +585,12 @@ class MultiDiscreteArray(BoundedArray):
         Raises:
             ValueError: if `num_values` are not all positive, if `dtype` is not integer.
         """
-        if (num_values <= 0).any() or not jnp.issubdtype(num_values.dtype, jnp.integer):
+        if (num_values <= 0).any() or np.dtype(num_values.dtype) not in _INTEGER_DTYPES:
             raise ValueError(
                 f"`num_values` must be an array of positive integers, got {num_values}."
             )
 
-        if not jnp.issubdtype(dtype, jnp.integer):
+        if np.dtype(dtype) not in _INTEGER_DTYPES:
             raise ValueError(f"`dtype` must be integer, got {dtype}.")
 
         num_values = num_values
@@ -502,14 +629,26 @@ class MultiDiscreteArray(BoundedArray):
             and (self.name == other.name)
         )
 
+    __hash__ = Array.__hash__
+
+
+if _DISABLE_SPEC_CHECKS:
+
+    def _skip_validation(self: Spec, value: T) -> T:
+        return value
+
+    Spec.validate = _skip_validation  # type: ignore[method-assign]
+    Array.validate = _skip_validation  # type: ignore[method-assign]
+    BoundedArray.validate = _skip_validation  # type: ignore[method-assign]
+
 
 def jumanji_specs_to_dm_env_specs(
     spec: Spec,
 ) -> Union[
-    dm_env.specs.DiscreteArray,
-    dm_env.specs.BoundedArray,
-    dm_env.specs.Array,
-    Dict[str, dm_env.specs.Array],
+    "dm_env.specs.DiscreteArray",
+    "dm_env.specs.BoundedArray",
+    "dm_env.specs.Array",
+    Dict[str, "dm_env.specs.Array"],
 ]:
     """Converts jumanji specs to dm_env specs or a tree of dm_env specs.
 
@@ -520,6 +659,30 @@ def jumanji_specs_to_dm_env_specs(
         `dm_env.specs.Array` or pytree of `dm_env.specs.Array` corresponding to the equivalent
             jumanji specs implementation.
     """
+    # The conversion is pure in the spec, which is immutable in practice, so
+    # memoize the result on the instance. Nested `Spec`s define `__eq__` without
+    # `__hash__` and therefore cannot key a dict or lru_cache. Sub-specs of
+    # nested specs cache their own conversions through the recursion.
+    try:
+        return spec.__dict__["_dm_env_spec"]
+    except KeyError:
+        pass
+    dm_env_spec = _jumanji_specs_to_dm_env_specs(spec)
+    spec.__dict__["_dm_env_spec"] = dm_env_spec
+    return dm_env_spec
+
+
+def _jumanji_specs_to_dm_env_specs(
+    spec: Spec,
+) -> Union[
+    "dm_env.specs.DiscreteArray",
+    "dm_env.specs.BoundedArray",
+    "dm_env.specs.Array",
+    Dict[str, "dm_env.specs.Array"],
+]:
+    """Uncached helper for `jumanji_specs_to_dm_env_specs`."""
+    import dm_env.specs
+
     if isinstance(spec, DiscreteArray):
         return dm_env.specs.DiscreteArray(
             num_values=spec.num_values,
@@ -553,11 +716,11 @@ def jumanji_specs_to_dm_env_specs(
 def jumanji_specs_to_gym_spaces(
     spec: Spec,
 ) -> Union[
-    gym.spaces.Box,
-    gym.spaces.Discrete,
-    gym.spaces.MultiDiscrete,
-    gym.spaces.Space,
-    gym.spaces.Dict,
+    "gym.spaces.Box",
+    "gym.spaces.Discrete",
+    "gym.spaces.MultiDiscrete",
+    "gym.spaces.Space",
+    "gym.spaces.Dict",
 ]:
     """Converts jumanji specs to gym spaces.
 
@@ -567,18 +730,37 @@ def jumanji_specs_to_gym_spaces(
     Returns:
         gym.spaces object corresponding to the equivalent jumanji specs implementation.
     """
+    # Memoized on the spec instance for the same reason as
+    # `jumanji_specs_to_dm_env_specs` above.
+    try:
+        return spec.__dict__["_gym_space"]
+    except KeyError:
+        pass
+    gym_space = _jumanji_specs_to_gym_spaces(spec)
+    spec.__dict__["_gym_space"] = gym_space
+    return gym_space
+
+
+def _jumanji_specs_to_gym_spaces(
+    spec: Spec,
+) -> Union[
+    "gym.spaces.Box",
+    "gym.spaces.Discrete",
+    "gym.spaces.MultiDiscrete",
+    "gym.spaces.Space",
+    "gym.spaces.Dict",
+]:
+    """Uncached helper for `jumanji_specs_to_gym_spaces`."""
+    import gym
+
     if isinstance(spec, DiscreteArray):
         return gym.spaces.Discrete(n=spec.num_values, seed=None)
     elif isinstance(spec, MultiDiscreteArray):
         return gym.spaces.MultiDiscrete(nvec=spec.num_values, seed=None)
     elif isinstance(spec, BoundedArray):
-        # When using NumPy: 1.21.5:
-        # MyPy error: "Call to untyped function "broadcast_to" in typed context"
-        low = np.broadcast_to(spec.minimum, shape=spec.shape)  # type: ignore
-        high = np.broadcast_to(spec.maximum, shape=spec.shape)  # type: ignore
         return gym.spaces.Box(
-            low=low,
-            high=high,
+            low=spec._np_minimum,
+            high=spec._np_maximum,
             shape=spec.shape,
             dtype=spec.dtype,
         )
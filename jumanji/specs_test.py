@@ -14,7 +14,10 @@
 
 # Adapted from dm_env.specs_test
 # ============================================================================
+import os
 import pickle
+import subprocess
+import sys
 from collections import namedtuple
 from typing import Any, NamedTuple, Sequence, Union
 
@@ -272,6 +275,14 @@ class TestBoundedArray:
         with pytest.raises(ValueError):
             specs.BoundedArray((3, 5), jnp.uint8, 0, (1, 1, 1))
 
+    def test_invalid_bounds_broadcast_with_but_not_to_shape(self) -> None:
+        """Bounds that broadcast with the shape but not to it must be rejected,
+        e.g. a (3,) bound against shape (3, 1) would broadcast to (3, 3)."""
+        with pytest.raises(ValueError):
+            specs.BoundedArray((3, 1), jnp.float32, jnp.zeros(3), 1.0)
+        with pytest.raises(ValueError):
+            specs.BoundedArray((3, 1), jnp.float32, 0.0, jnp.ones(3))
+
     def test_min_max_attributes(self) -> None:
         spec = specs.BoundedArray((1, 2, 3), jnp.float32, 0, (5, 5, 5))
         assert isinstance(spec.minimum, jnp.ndarray)
@@ -759,3 +770,24 @@ class TestJumanjiSpecsToGymSpaces:
         converted_spec = specs.jumanji_specs_to_gym_spaces(not_jumanji_type_spec)
         assert isinstance(converted_spec, gym.spaces.Dict)
         assert not converted_spec  # Check that the dictionary is empty
+
+
+def test_disable_spec_checks_env_var() -> None:
+    """Checks that setting `JUMANJI_DISABLE_SPEC_CHECKS` turns `validate` into
+    an identity pass-through, including for subclasses such as `DiscreteArray`
+    that inherit it. The flag takes effect at import time, hence the
+    subprocess."""
+    script = "\n".join(
+        [
+            "import jax.numpy as jnp",
+            "from jumanji import specs",
+            "bounded = specs.BoundedArray((2,), jnp.float32, 0.0, 1.0)",
+            "wrong_shape_and_bounds = jnp.full((3,), 5.0)",
+            "assert bounded.validate(wrong_shape_and_bounds) is wrong_shape_and_bounds",
+            "discrete = specs.DiscreteArray(3)",
+            "out_of_bounds = jnp.array(7, jnp.int32)",
+            "assert discrete.validate(out_of_bounds) is out_of_bounds",
+        ]
+    )
+    env = {**os.environ, "JUMANJI_DISABLE_SPEC_CHECKS": "1"}
+    subprocess.run([sys.executable, "-c", script], env=env, check=True)
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import functools
 from typing import Any, Callable, Dict, Tuple
 
 import chex
@@ -20,7 +19,6 @@ import haiku as hk
 import jax
 import jax.numpy as jnp
 import optax
-import rlax
 
 from jumanji.env import Environment
 from jumanji.training.agents.base import Agent
@@ -54,6 +52,14 @@ class A2CAgent(Agent):
         self.observation_spec = env.observation_spec()
         self.n_steps = n_steps
         self.actor_critic_networks = actor_critic_networks
+        # Resolve the network applies and the action distribution once; the
+        # rollout and loss closures then reference plain locals instead of
+        # walking the attribute chain at every trace.
+        self._policy_apply = actor_critic_networks.policy_network.apply
+        self._value_apply = actor_critic_networks.value_network.apply
+        self._parametric_action_distribution = (
+            actor_critic_networks.parametric_action_distribution
+        )
         self.optimizer = optimizer
         self.normalize_advantage = normalize_advantage
         self.discount_factor = discount_factor
@@ -109,42 +115,42 @@ class A2CAgent(Agent):
         params: ActorCriticParams,
         acting_state: ActingState,
     ) -> Tuple[float, Tuple[ActingState, Dict]]:
-        parametric_action_distribution = (
-            self.actor_critic_networks.parametric_action_distribution
-        )
-        value_apply = self.actor_critic_networks.value_network.apply
+        value_apply = self._value_apply
 
         acting_state, data = self.rollout(
-            policy_params=params.actor,
+            params=params,
             acting_state=acting_state,
         )  # data.shape == (T, B, ...)
-        last_observation = jax.tree_util.tree_map(
-            lambda x: x[-1], data.next_observation
-        )
-        observation = jax.tree_util.tree_map(
-            lambda obs_0_tm1, obs_t: jnp.concatenate([obs_0_tm1, obs_t[None]], axis=0),
-            data.observation,
-            last_observation,
-        )
-
-        value = jax.vmap(value_apply, in_axes=(None, 0))(params.critic, observation)
+        # Per-step values were computed inside the rollout scan, so only the
+        # bootstrap value of the final observation is left to evaluate — no
+        # (T, B, *obs) observation tensor is stacked or concatenated.
+        last_value = value_apply(params.critic, acting_state.timestep.observation)
+        value = jnp.concatenate([data.value, last_value[None]], axis=0)
         discounts = jnp.asarray(self.discount_factor * data.discount, float)
         value_tm1 = value[:-1]
         value_t = value[1:]
-        advantage = jax.vmap(
-            functools.partial(
-                rlax.td_lambda,
-                lambda_=self.bootstrapping_factor,
-                stop_target_gradients=True,
-            ),
-            in_axes=1,
-            out_axes=1,
-        )(
-            value_tm1,
-            data.reward,
-            discounts,
-            value_t,
+        # Compute the TD(lambda) errors with a single reverse scan over the
+        # (T, B) arrays, carrying a whole batch row per step. This is the same
+        # recursion as `rlax.td_lambda` without composing vmap over a scan,
+        # and it needs no transposes since time is already the leading axis.
+        lambda_ = self.bootstrapping_factor
+
+        def lambda_returns_step(
+            target_t: chex.Array, inputs: Tuple[chex.Array, chex.Array, chex.Array]
+        ) -> Tuple[chex.Array, chex.Array]:
+            reward_t, discount_t, value_t_ = inputs
+            target_tm1 = reward_t + discount_t * (
+                (1 - lambda_) * value_t_ + lambda_ * target_t
+            )
+            return target_tm1, target_tm1
+
+        _, target = jax.lax.scan(
+            lambda_returns_step,
+            value_t[-1],
+            (data.reward, discounts, value_t),
+            reverse=True,
         )
+        advantage = jax.lax.stop_gradient(target) - value_tm1
 
         # Compute the critic loss before potentially normalizing the advantages.
         critic_loss = jnp.mean(advantage**2)
@@ -152,14 +158,19 @@ class A2CAgent(Agent):
         # Compute the policy loss with optional advantage normalization.
         metrics: Dict = {}
         if self.normalize_advantage:
-            metrics.update(unnormalized_advantage=jnp.mean(advantage))
-            advantage = jax.nn.standardize(advantage)
+            # Standardize per time step over the batch axis, like
+            # `jax.nn.standardize`, reusing the mean for the metrics rather
+            # than taking a separate pass over the advantages.
+            mean = jnp.mean(advantage, axis=-1, keepdims=True)
+            metrics.update(unnormalized_advantage=jnp.mean(mean))
+            centered = advantage - mean
+            variance = jnp.mean(jnp.square(centered), axis=-1, keepdims=True)
+            advantage = centered * jax.lax.rsqrt(variance + 1e-5)
         policy_loss = -jnp.mean(jax.lax.stop_gradient(advantage) * data.log_prob)
 
-        # Compute the entropy loss, i.e. negative of the entropy.
-        entropy = jnp.mean(
-            parametric_action_distribution.entropy(data.logits, acting_state.key)
-        )
+        # Compute the entropy loss, i.e. negative of the entropy. Per-step
+        # entropies were already computed during the rollout.
+        entropy = jnp.mean(data.entropy)
         entropy_loss = -entropy
 
         total_loss = (
@@ -185,15 +196,13 @@ class A2CAgent(Agent):
     ) -> Callable[
         [Any, chex.PRNGKey], Tuple[chex.Array, Tuple[chex.Array, chex.Array]]
     ]:
-        policy_network = self.actor_critic_networks.policy_network
-        parametric_action_distribution = (
-            self.actor_critic_networks.parametric_action_distribution
-        )
+        policy_apply = self._policy_apply
+        parametric_action_distribution = self._parametric_action_distribution
 
         def policy(
             observation: Any, key: chex.PRNGKey
         ) -> Tuple[chex.Array, Tuple[chex.Array, chex.Array]]:
-            logits = policy_network.apply(policy_params, observation)
+            logits = policy_apply(policy_params, observation)
             if stochastic:
                 raw_action = parametric_action_distribution.sample_no_postprocessing(
                     logits, key
@@ -215,47 +224,73 @@ class A2CAgent(Agent):
 
     def rollout(
         self,
-        policy_params: hk.Params,
+        params: ActorCriticParams,
         acting_state: ActingState,
     ) -> Tuple[ActingState, Transition]:
         """Rollout for training purposes.
         Returns:
             shape (n_steps, batch_size_per_device, *)
         """
-        policy = self.make_policy(policy_params=policy_params, stochastic=True)
+        policy = self.make_policy(policy_params=params.actor, stochastic=True)
+        value_apply = self._value_apply
+        parametric_action_distribution = self._parametric_action_distribution
 
         def run_one_step(
             acting_state: ActingState, key: chex.PRNGKey
         ) -> Tuple[ActingState, Transition]:
             timestep = acting_state.timestep
             action, (log_prob, logits) = policy(timestep.observation, key)
+            value = value_apply(params.critic, timestep.observation)
             next_env_state, next_timestep = self.env.step(acting_state.state, action)
 
             acting_state = ActingState(
                 state=next_env_state,
                 timestep=next_timestep,
                 key=key,
-                episode_count=acting_state.episode_count
-                + jax.lax.psum(next_timestep.last().sum(), "devices"),
-                env_step_count=acting_state.env_step_count
-                + jax.lax.psum(self.batch_size_per_device, "devices"),
+                # Finished episodes are summed over devices once after the
+                # scan, not with a collective at every step.
+                episode_count=acting_state.episode_count,
+                # Each device steps batch_size_per_device environments, so the
+                # global increment is the static total batch size — no need to
+                # all-reduce a compile-time constant every step.
+                env_step_count=acting_state.env_step_count + self.total_batch_size,
             )
 
             transition = Transition(
-                observation=timestep.observation,
+                value=value,
                 action=action,
                 reward=next_timestep.reward,
                 discount=next_timestep.discount,
-                next_observation=next_timestep.observation,
                 log_prob=log_prob,
-                logits=logits,
+                # Entropy is computed while the step's softmax is warm rather
+                # than from the stacked logits after the scan.
+                entropy=parametric_action_distribution.entropy(logits, key),
                 extras=next_timestep.extras,
             )
 
-            return acting_state, transition
+            return acting_state, (transition, next_timestep.last().sum())
+
+        # Rematerialize each step's activations during backprop instead of
+        # keeping them alive for the whole trajectory, so the peak activation
+        # memory no longer grows with n_steps. prevent_cse is safe to disable
+        # under scan, per the jax.checkpoint documentation.
+        run_one_step = jax.checkpoint(  # type: ignore
+            run_one_step,
+            prevent_cse=False,
+            policy=jax.checkpoint_policies.nothing_saveable,
+        )
 
-        acting_keys = jax.random.split(acting_state.key, self.n_steps).reshape(
-            (self.n_steps, -1)
+        # `split` already returns a (n_steps, 2) array of keys, one per step.
+        acting_keys = jax.random.split(acting_state.key, self.n_steps)
+        # A small unroll lets XLA fuse across consecutive scan bodies without
+        # the compile-time blow-up of unrolling the whole rollout.
+        acting_state, (data, done_counts) = jax.lax.scan(
+            run_one_step, acting_state, acting_keys, unroll=min(self.n_steps, 4)
+        )
+        # Single all-reduce over the rollout's episode terminations, instead
+        # of one scalar collective inside every scan step.
+        acting_state = acting_state._replace(
+            episode_count=acting_state.episode_count
+            + jax.lax.psum(done_counts.sum(), "devices")
         )
-        acting_state, data = jax.lax.scan(run_one_step, acting_state, acting_keys)
         return acting_state, data
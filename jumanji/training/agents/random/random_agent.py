@@ -89,8 +89,11 @@ class RandomAgent(Agent):
             extras = next_timestep.extras
             return acting_state, extras
 
-        acting_keys = jax.random.split(acting_state.key, self.n_steps).reshape(
-            (self.n_steps, -1)
+        # `split` already returns a (n_steps, 2) array of keys, one per step.
+        acting_keys = jax.random.split(acting_state.key, self.n_steps)
+        # A small unroll lets XLA fuse across consecutive scan bodies without
+        # the compile-time blow-up of unrolling the whole rollout.
+        acting_state, extras = jax.lax.scan(
+            run_one_step, acting_state, acting_keys, unroll=min(self.n_steps, 4)
         )
-        acting_state, extras = jax.lax.scan(run_one_step, acting_state, acting_keys)
         return acting_state, extras
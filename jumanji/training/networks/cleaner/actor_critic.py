@@ -71,9 +71,9 @@ def all_agents_channel(agents_locations: chex.Array, grid: chex.Array) -> chex.A
         array: a 2D jax array containing the number of agents on each tile.
     """
     xs, ys = agents_locations[:, 0], agents_locations[:, 1]
-    num_agents = agents_locations.shape[0]
-    agents_channel = jnp.repeat(jnp.zeros_like(grid)[None, :, :], num_agents, axis=0)
-    return jnp.sum(agents_channel.at[jnp.arange(num_agents), xs, ys].set(1), axis=0)
+    # A single scatter-add counts agents per tile without materializing one
+    # grid copy per agent.
+    return jnp.zeros_like(grid).at[xs, ys].add(1)
 
 
 def process_obs_for_critic(observation: Observation) -> chex.Array:
@@ -184,10 +184,9 @@ def make_actor_network(
         obs = jax.vmap(process_obs_for_actor)(observation)  # (B, N, H, W, 4)
         embedding = jax.vmap(torso)(obs)  # (B, N, W * H)
         num_agents = obs.shape[1]
-        normalised_step_count = jnp.repeat(
+        normalised_step_count = jnp.broadcast_to(
             jnp.expand_dims(observation.step_count, axis=(1, 2)) / time_limit,
-            num_agents,
-            axis=1,
+            (*observation.step_count.shape, num_agents, 1),
         )  # (B, N, 1)
         output = jnp.concatenate(
             [embedding, normalised_step_count], axis=-1
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple
+from typing import Callable, Dict, Tuple, Type
 
 import chex
 import jax
@@ -123,171 +123,75 @@ def setup_agent(cfg: DictConfig, env: Environment) -> Agent:
     return agent
 
 
-def _setup_random_policy(  # noqa: CCR001
-    cfg: DictConfig, env: Environment
-) -> RandomPolicy:
+# Dispatch tables mapping an environment name to its environment class and
+# network factory, replacing if/elif cascades that grew with every new
+# environment. Random-policy factories are wrapped in lambdas so that they all
+# take the unwrapped environment, whether they need it or not.
+_RANDOM_POLICY_FACTORY: Dict[
+    str, Tuple[Type[Environment], Callable[[Environment], RandomPolicy]]
+] = {
+    "bin_pack": (
+        BinPack,
+        lambda env: networks.make_random_policy_bin_pack(bin_pack=env),
+    ),
+    "snake": (Snake, lambda env: networks.make_random_policy_snake()),
+    "tsp": (TSP, lambda env: networks.make_random_policy_tsp()),
+    "knapsack": (Knapsack, lambda env: networks.make_random_policy_knapsack()),
+    "job_shop": (JobShop, lambda env: networks.make_random_policy_job_shop()),
+    "cvrp": (CVRP, lambda env: networks.make_random_policy_cvrp()),
+    "rubiks_cube": (
+        RubiksCube,
+        lambda env: networks.make_random_policy_rubiks_cube(rubiks_cube=env),
+    ),
+    "minesweeper": (
+        Minesweeper,
+        lambda env: networks.make_random_policy_minesweeper(minesweeper=env),
+    ),
+    "game_2048": (Game2048, lambda env: networks.make_random_policy_game_2048()),
+    "cleaner": (Cleaner, lambda env: networks.make_random_policy_cleaner()),
+    "maze": (Maze, lambda env: networks.make_random_policy_maze()),
+    "connector": (Connector, lambda env: networks.make_random_policy_connector()),
+}
+
+# Actor-critic factories all take the unwrapped environment as first argument
+# followed by the keyword arguments found in the `network` section of the
+# environment's config.
+_ACTOR_CRITIC_FACTORY: Dict[
+    str, Tuple[Type[Environment], Callable[..., ActorCriticNetworks]]
+] = {
+    "bin_pack": (BinPack, networks.make_actor_critic_networks_bin_pack),
+    "snake": (Snake, networks.make_actor_critic_networks_snake),
+    "tsp": (TSP, networks.make_actor_critic_networks_tsp),
+    "knapsack": (Knapsack, networks.make_actor_critic_networks_knapsack),
+    "job_shop": (JobShop, networks.make_actor_critic_networks_job_shop),
+    "cvrp": (CVRP, networks.make_actor_critic_networks_cvrp),
+    "game_2048": (Game2048, networks.make_actor_critic_networks_game_2048),
+    "rubiks_cube": (RubiksCube, networks.make_actor_critic_networks_rubiks_cube),
+    "minesweeper": (Minesweeper, networks.make_actor_critic_networks_minesweeper),
+    "maze": (Maze, networks.make_actor_critic_networks_maze),
+    "cleaner": (Cleaner, networks.make_actor_critic_networks_cleaner),
+    "connector": (Connector, networks.make_actor_critic_networks_connector),
+}
+
+
+def _setup_random_policy(cfg: DictConfig, env: Environment) -> RandomPolicy:
     assert cfg.agent == "random"
-    if cfg.env.name == "bin_pack":
-        assert isinstance(env.unwrapped, BinPack)
-        random_policy = networks.make_random_policy_bin_pack(bin_pack=env.unwrapped)
-    elif cfg.env.name == "snake":
-        assert isinstance(env.unwrapped, Snake)
-        random_policy = networks.make_random_policy_snake()
-    elif cfg.env.name == "tsp":
-        assert isinstance(env.unwrapped, TSP)
-        random_policy = networks.make_random_policy_tsp()
-    elif cfg.env.name == "knapsack":
-        assert isinstance(env.unwrapped, Knapsack)
-        random_policy = networks.make_random_policy_knapsack()
-    elif cfg.env.name == "job_shop":
-        assert isinstance(env.unwrapped, JobShop)
-        random_policy = networks.make_random_policy_job_shop()
-    elif cfg.env.name == "cvrp":
-        assert isinstance(env.unwrapped, CVRP)
-        random_policy = networks.make_random_policy_cvrp()
-    elif cfg.env.name == "rubiks_cube":
-        assert isinstance(env.unwrapped, RubiksCube)
-        random_policy = networks.make_random_policy_rubiks_cube(
-            rubiks_cube=env.unwrapped
-        )
-    elif cfg.env.name == "minesweeper":
-        assert isinstance(env.unwrapped, Minesweeper)
-        random_policy = networks.make_random_policy_minesweeper(
-            minesweeper=env.unwrapped
-        )
-    elif cfg.env.name == "game_2048":
-        assert isinstance(env.unwrapped, Game2048)
-        random_policy = networks.make_random_policy_game_2048()
-    elif cfg.env.name == "cleaner":
-        assert isinstance(env.unwrapped, Cleaner)
-        random_policy = networks.make_random_policy_cleaner()
-    elif cfg.env.name == "maze":
-        assert isinstance(env.unwrapped, Maze)
-        random_policy = networks.make_random_policy_maze()
-    elif cfg.env.name == "connector":
-        assert isinstance(env.unwrapped, Connector)
-        random_policy = networks.make_random_policy_connector()
-    else:
+    if cfg.env.name not in _RANDOM_POLICY_FACTORY:
         raise ValueError(f"Environment name not found. Got {cfg.env.name}.")
-    return random_policy
+    env_class, make_random_policy = _RANDOM_POLICY_FACTORY[cfg.env.name]
+    assert isinstance(env.unwrapped, env_class)
+    return make_random_policy(env.unwrapped)
 
 
-def _setup_actor_critic_neworks(  # noqa: CCR001
+def _setup_actor_critic_neworks(
     cfg: DictConfig, env: Environment
 ) -> ActorCriticNetworks:
     assert cfg.agent == "a2c"
-    if cfg.env.name == "bin_pack":
-        assert isinstance(env.unwrapped, BinPack)
-        actor_critic_networks = networks.make_actor_critic_networks_bin_pack(
-            bin_pack=env.unwrapped,
-            num_transformer_layers=cfg.env.network.num_transformer_layers,
-            transformer_num_heads=cfg.env.network.transformer_num_heads,
-            transformer_key_size=cfg.env.network.transformer_key_size,
-            transformer_mlp_units=cfg.env.network.transformer_mlp_units,
-        )
-    elif cfg.env.name == "snake":
-        assert isinstance(env.unwrapped, Snake)
-        actor_critic_networks = networks.make_actor_critic_networks_snake(
-            snake=env.unwrapped,
-            num_channels=cfg.env.network.num_channels,
-            policy_layers=cfg.env.network.policy_layers,
-            value_layers=cfg.env.network.value_layers,
-        )
-    elif cfg.env.name == "tsp":
-        assert isinstance(env.unwrapped, TSP)
-        actor_critic_networks = networks.make_actor_critic_networks_tsp(
-            tsp=env.unwrapped,
-            transformer_num_blocks=cfg.env.network.transformer_num_blocks,
-            transformer_num_heads=cfg.env.network.transformer_num_heads,
-            transformer_key_size=cfg.env.network.transformer_key_size,
-            transformer_mlp_units=cfg.env.network.transformer_mlp_units,
-            mean_cities_in_query=cfg.env.network.mean_cities_in_query,
-        )
-    elif cfg.env.name == "knapsack":
-        assert isinstance(env.unwrapped, Knapsack)
-        actor_critic_networks = networks.make_actor_critic_networks_knapsack(
-            knapsack=env.unwrapped,
-            transformer_num_blocks=cfg.env.network.transformer_num_blocks,
-            transformer_num_heads=cfg.env.network.transformer_num_heads,
-            transformer_key_size=cfg.env.network.transformer_key_size,
-            transformer_mlp_units=cfg.env.network.transformer_mlp_units,
-        )
-    elif cfg.env.name == "job_shop":
-        assert isinstance(env.unwrapped, JobShop)
-        actor_critic_networks = networks.make_actor_critic_networks_job_shop(
-            job_shop=env.unwrapped,
-            num_layers_machines=cfg.env.network.num_layers_machines,
-            num_layers_operations=cfg.env.network.num_layers_operations,
-            num_layers_joint_machines_jobs=cfg.env.network.num_layers_joint_machines_jobs,
-            transformer_num_heads=cfg.env.network.transformer_num_heads,
-            transformer_key_size=cfg.env.network.transformer_key_size,
-            transformer_mlp_units=cfg.env.network.transformer_mlp_units,
-        )
-    elif cfg.env.name == "cvrp":
-        assert isinstance(env.unwrapped, CVRP)
-        actor_critic_networks = networks.make_actor_critic_networks_cvrp(
-            cvrp=env.unwrapped,
-            transformer_num_blocks=cfg.env.network.transformer_num_blocks,
-            transformer_num_heads=cfg.env.network.transformer_num_heads,
-            transformer_key_size=cfg.env.network.transformer_key_size,
-            transformer_mlp_units=cfg.env.network.transformer_mlp_units,
-            mean_nodes_in_query=cfg.env.network.mean_nodes_in_query,
-        )
-    elif cfg.env.name == "game_2048":
-        assert isinstance(env.unwrapped, Game2048)
-        actor_critic_networks = networks.make_actor_critic_networks_game_2048(
-            game_2048=env.unwrapped,
-            num_channels=cfg.env.network.num_channels,
-            policy_layers=cfg.env.network.policy_layers,
-            value_layers=cfg.env.network.value_layers,
-        )
-    elif cfg.env.name == "rubiks_cube":
-        assert isinstance(env.unwrapped, RubiksCube)
-        actor_critic_networks = networks.make_actor_critic_networks_rubiks_cube(
-            rubiks_cube=env.unwrapped,
-            cube_embed_dim=cfg.env.network.cube_embed_dim,
-            step_count_embed_dim=cfg.env.network.step_count_embed_dim,
-            dense_layer_dims=cfg.env.network.dense_layer_dims,
-        )
-    elif cfg.env.name == "minesweeper":
-        assert isinstance(env.unwrapped, Minesweeper)
-        actor_critic_networks = networks.make_actor_critic_networks_minesweeper(
-            minesweeper=env.unwrapped,
-            board_embed_dim=cfg.env.network.board_embed_dim,
-            board_conv_channels=cfg.env.network.board_conv_channels,
-            board_kernel_shape=cfg.env.network.board_kernel_shape,
-            num_mines_embed_dim=cfg.env.network.num_mines_embed_dim,
-            final_layer_dims=cfg.env.network.final_layer_dims,
-        )
-    elif cfg.env.name == "maze":
-        assert isinstance(env.unwrapped, Maze)
-        actor_critic_networks = networks.make_actor_critic_networks_maze(
-            maze=env.unwrapped,
-            num_channels=cfg.env.network.num_channels,
-            policy_layers=cfg.env.network.policy_layers,
-            value_layers=cfg.env.network.value_layers,
-        )
-    elif cfg.env.name == "cleaner":
-        assert isinstance(env.unwrapped, Cleaner)
-        actor_critic_networks = networks.make_actor_critic_networks_cleaner(
-            cleaner=env.unwrapped,
-            num_conv_channels=cfg.env.network.num_conv_channels,
-            policy_layers=cfg.env.network.policy_layers,
-            value_layers=cfg.env.network.value_layers,
-        )
-    elif cfg.env.name == "connector":
-        assert isinstance(env.unwrapped, Connector)
-        actor_critic_networks = networks.make_actor_critic_networks_connector(
-            connector=env.unwrapped,
-            transformer_num_blocks=cfg.env.network.transformer_num_blocks,
-            transformer_num_heads=cfg.env.network.transformer_num_heads,
-            transformer_key_size=cfg.env.network.transformer_key_size,
-            transformer_mlp_units=cfg.env.network.transformer_mlp_units,
-            conv_n_channels=cfg.env.network.conv_n_channels,
-        )
-    else:
+    if cfg.env.name not in _ACTOR_CRITIC_FACTORY:
         raise ValueError(f"Environment name not found. Got {cfg.env.name}.")
-    return actor_critic_networks
+    env_class, make_actor_critic_networks = _ACTOR_CRITIC_FACTORY[cfg.env.name]
+    assert isinstance(env.unwrapped, env_class)
+    return make_actor_critic_networks(env.unwrapped, **cfg.env.network)
 
 
 def setup_evaluators(cfg: DictConfig, agent: Agent) -> Tuple[Evaluator, Evaluator]:
@@ -312,29 +216,29 @@ def setup_training_state(
 ) -> TrainingState:
     params_key, reset_key, acting_key = jax.random.split(key, 3)
 
-    # Initialize params.
-    params_state = agent.init_params(params_key)
-
-    # Initialize environment states.
     num_devices = jax.local_device_count()
     reset_keys = jax.random.split(reset_key, agent.total_batch_size).reshape(
         (num_devices, agent.batch_size_per_device, -1)
     )
-    env_state, timestep = jax.pmap(env.reset, axis_name="devices")(reset_keys)
-
-    # Initialize acting states.
     acting_key_per_device = jax.random.split(acting_key, num_devices)
-    acting_state = ActingState(
-        state=env_state,
-        timestep=timestep,
-        key=acting_key_per_device,
-        episode_count=jnp.zeros(num_devices, float),
-        env_step_count=jnp.zeros(num_devices, float),
-    )
 
-    # Build the training state.
-    training_state = TrainingState(
-        params_state=jax.device_put_replicated(params_state, jax.local_devices()),
-        acting_state=acting_state,
-    )
-    return training_state
+    def init(reset_key: chex.PRNGKey, acting_key: chex.PRNGKey) -> TrainingState:
+        env_state, timestep = env.reset(reset_key)
+        acting_state = ActingState(
+            state=env_state,
+            timestep=timestep,
+            key=acting_key,
+            episode_count=jnp.array(0, float),
+            env_step_count=jnp.array(0, float),
+        )
+        # The params key is closed over, so every device initializes the same
+        # replicated parameters.
+        return TrainingState(
+            params_state=agent.init_params(params_key),
+            acting_state=acting_state,
+        )
+
+    # A single pmap builds the whole training state on device: environment
+    # reset, parameter/optimizer initialization and replication happen in one
+    # compiled call, with no separate host-side broadcast of the params.
+    return jax.pmap(init, axis_name="devices")(reset_keys, acting_key_per_device)
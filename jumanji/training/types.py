@@ -22,15 +22,16 @@ from jumanji.types import TimeStep
 
 
 class Transition(NamedTuple):
-    """Container for a transition."""
+    """Container for a transition. The observation is consumed by the critic
+    during the rollout and only its value estimate is kept, so that no
+    (n_steps, batch_size, *obs) tensor is ever stacked."""
 
-    observation: chex.ArrayTree
+    value: chex.ArrayTree
     action: chex.ArrayTree
     reward: chex.ArrayTree
     discount: chex.ArrayTree
-    next_observation: chex.ArrayTree
     log_prob: chex.ArrayTree
-    logits: chex.ArrayTree
+    entropy: chex.ArrayTree
     extras: Optional[Dict]
 
 
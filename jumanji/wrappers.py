@@ -40,6 +40,10 @@ Observation = TypeVar("Observation")
 # Type alias that corresponds to ObsType in the Gym API
 GymObservation = Any
 
+# Number of reset keys pre-split in one bulk `jax.random.split` by the dm_env
+# and gym wrappers, instead of a small two-key split at every episode start.
+_RESET_KEY_POOL_SIZE = 1024
+
 
 class Wrapper(Environment[State], Generic[State]):
     """Wraps the environment to allow modular transformations.
@@ -56,12 +60,30 @@ class Wrapper(Environment[State], Generic[State]):
     def __getattr__(self, name: str) -> Any:
         if name == "__setstate__":
             raise AttributeError(name)
-        return getattr(self._env, name)
+        # Delegated attributes are cached in a dedicated mapping so that
+        # repeated lookups do not walk the wrapper chain — with stacked
+        # wrappers each walk is O(depth) — while never shadowing the
+        # wrapper's own `__dict__` entries.
+        cache = self.__dict__.setdefault("_delegated_attrs", {})
+        try:
+            return cache[name]
+        except KeyError:
+            attr = getattr(self._env, name)
+            # Underscore attributes may be lazily (re)assigned by the wrapped
+            # environment, so only public attributes are cached.
+            if not name.startswith("_"):
+                cache[name] = attr
+            return attr
 
     @property
     def unwrapped(self) -> Environment:
-        """Returns the wrapped env."""
-        return self._env.unwrapped
+        """Returns the wrapped env. The chain below never changes, so it is
+        only walked once."""
+        try:
+            return self.__dict__["_unwrapped"]
+        except KeyError:
+            unwrapped = self.__dict__["_unwrapped"] = self._env.unwrapped
+            return unwrapped
 
     def reset(self, key: chex.PRNGKey) -> Tuple[State, TimeStep]:
         """Resets the environment to an initial state.
@@ -89,12 +111,22 @@ class Wrapper(Environment[State], Generic[State]):
         return self._env.step(state, action)
 
     def observation_spec(self) -> specs.Spec:
-        """Returns the observation spec."""
-        return self._env.observation_spec()
+        """Returns the observation spec. The spec is computed on first access
+        and then cached, as some environments rebuild it on every call."""
+        try:
+            return self.__dict__["_observation_spec"]
+        except KeyError:
+            spec = self.__dict__["_observation_spec"] = self._env.observation_spec()
+            return spec
 
     def action_spec(self) -> specs.Spec:
-        """Returns the action spec."""
-        return self._env.action_spec()
+        """Returns the action spec. The spec is computed on first access and
+        then cached, as some environments rebuild it on every call."""
+        try:
+            return self.__dict__["_action_spec"]
+        except KeyError:
+            spec = self.__dict__["_action_spec"] = self._env.action_spec()
+            return spec
 
     def render(self, state: State) -> Any:
         """Compute render frames during initialisation of the environment.
@@ -135,16 +167,47 @@ class JumanjiToDMEnvWrapper(dm_env.Environment):
         else:
             self._key = key
         self._state: Any
-        self._jitted_reset: Callable[[chex.PRNGKey], Tuple[State, TimeStep]] = jax.jit(
-            self._env.reset
+        self._refill_key_pool(self._key)
+        # Compile reset and step ahead of time, so that the first call to
+        # either does not stall on compilation.
+        dummy_key = jax.ShapeDtypeStruct(self._key.shape, self._key.dtype)
+        self._jitted_reset: Callable[[chex.PRNGKey], Tuple[State, TimeStep]] = (
+            jax.jit(self._env.reset).lower(dummy_key).compile()
+        )
+        state_aval, _ = jax.eval_shape(self._env.reset, dummy_key)
+        action_spec = self._env.action_spec()
+        self._action_dtype = action_spec.dtype
+        dummy_action = jax.ShapeDtypeStruct(action_spec.shape, action_spec.dtype)
+        # The state buffers are not donated: the returned timestep exposes raw
+        # JAX arrays that may alias state leaves (e.g. an observation built
+        # from a state array), so donating the previous state could invalidate
+        # a timestep the caller still holds.
+        self._jitted_step: Callable[[State, chex.Array], Tuple[State, TimeStep]] = (
+            jax.jit(self._env.step).lower(state_aval, dummy_action).compile()
+        )
+        # Convert the specs once rather than on every spec access.
+        self._observation_spec = specs.jumanji_specs_to_dm_env_specs(
+            self._env.observation_spec()
+        )
+        self._action_spec = specs.jumanji_specs_to_dm_env_specs(
+            self._env.action_spec()
         )
-        self._jitted_step: Callable[
-            [State, chex.Array], Tuple[State, TimeStep]
-        ] = jax.jit(self._env.step)
 
     def __repr__(self) -> str:
         return str(self._env.__repr__())
 
+    def _refill_key_pool(self, key: chex.PRNGKey) -> None:
+        # The last key of the pool is reserved for the next refill.
+        self._key_pool = jax.random.split(key, _RESET_KEY_POOL_SIZE + 1)
+        self._key_idx = 0
+
+    def _next_reset_key(self) -> chex.PRNGKey:
+        if self._key_idx == _RESET_KEY_POOL_SIZE:
+            self._refill_key_pool(self._key_pool[-1])
+        reset_key = self._key_pool[self._key_idx]
+        self._key_idx += 1
+        return reset_key
+
     def reset(self) -> dm_env.TimeStep:
         """Starts a new sequence and returns the first `TimeStep` of this sequence.
 
@@ -158,9 +221,9 @@ class JumanjiToDMEnvWrapper(dm_env.Environment):
                     are also valid in place of a scalar array. Must conform to the
                     specification returned by `observation_spec()`.
         """
-        reset_key, self._key = jax.random.split(self._key)
-        self._state, timestep = self._jitted_reset(reset_key)
-        return dm_env.restart(observation=timestep.observation)
+        self._state, timestep = self._jitted_reset(self._next_reset_key())
+        # Equivalent to `dm_env.restart` without the constructor indirection.
+        return dm_env.TimeStep(dm_env.StepType.FIRST, None, None, timestep.observation)
 
     def step(self, action: chex.ArrayNumpy) -> dm_env.TimeStep:
         """Updates the environment according to the action and returns a `TimeStep`.
@@ -191,21 +254,23 @@ class JumanjiToDMEnvWrapper(dm_env.Environment):
                     are also valid in place of a scalar array. Must conform to the
                     specification returned by `observation_spec()`.
         """
+        # Cast to the action spec's dtype with numpy: the compiled step takes
+        # numpy arrays directly, so no device buffer is built in Python here.
+        action = np.asarray(action, self._action_dtype)
         self._state, timestep = self._jitted_step(self._state, action)
-        return dm_env.TimeStep(
-            step_type=timestep.step_type,
-            reward=timestep.reward,
-            discount=timestep.discount,
-            observation=timestep.observation,
+        # The fields line up with dm_env's (step_type, reward, discount,
+        # observation) namedtuple, so `_make` rebuilds it positionally.
+        return dm_env.TimeStep._make(
+            (timestep.step_type, timestep.reward, timestep.discount, timestep.observation)
         )
 
     def observation_spec(self) -> dm_env.specs.Array:
         """Returns the dm_env observation spec."""
-        return specs.jumanji_specs_to_dm_env_specs(self._env.observation_spec())
+        return self._observation_spec
 
     def action_spec(self) -> dm_env.specs.Array:
         """Returns the dm_env action spec."""
-        return specs.jumanji_specs_to_dm_env_specs(self._env.action_spec())
+        return self._action_spec
 
     @property
     def unwrapped(self) -> Environment:
@@ -233,6 +298,14 @@ class MultiToSingleWrapper(Wrapper):
         super().__init__(env)
         self._reward_aggregator = reward_aggregator
         self._discount_aggregator = discount_aggregator
+        # Fuse both aggregations into one jitted call, so standalone use pays
+        # a single dispatch per step. Inside an outer jit this is inlined.
+        self._fused_aggregate = jax.jit(
+            lambda reward, discount: (
+                reward_aggregator(reward),
+                discount_aggregator(discount),
+            )
+        )
 
     def _aggregate_timestep(self, timestep: TimeStep) -> TimeStep:
         """Apply the reward and discount aggregator to a multi-agent
@@ -245,11 +318,12 @@ class MultiToSingleWrapper(Wrapper):
         Return:
             a single agent compatible timestep object."""
 
+        reward, discount = self._fused_aggregate(timestep.reward, timestep.discount)
         return TimeStep(
             step_type=timestep.step_type,
             observation=timestep.observation,
-            reward=self._reward_aggregator(timestep.reward),
-            discount=self._discount_aggregator(timestep.discount),
+            reward=reward,
+            discount=discount,
             extras=timestep.extras,
         )
 
@@ -299,6 +373,19 @@ class VmapWrapper(Wrapper):
     - discount_spec
     """
 
+    def __init__(self, env: Environment):
+        super().__init__(env)
+        # Vmap and jit reset/step once: building `jax.vmap(...)` inside each
+        # call re-runs its Python trampoline every time even though the trace
+        # itself is cached.
+        self._vmapped_reset = jax.jit(jax.vmap(self._env.reset))
+        self._vmapped_step = jax.jit(jax.vmap(self._env.step))
+        # Jitted slice of the first environment of the batch, so that render
+        # does not walk the state pytree in Python on every frame.
+        self._slice_first = jax.jit(
+            lambda state: jax.tree_util.tree_map(lambda x: x[0], state)
+        )
+
     def reset(self, key: chex.PRNGKey) -> Tuple[State, TimeStep[Observation]]:
         """Resets the environment to an initial state.
 
@@ -316,7 +403,7 @@ class VmapWrapper(Wrapper):
             timestep: TimeStep object corresponding the first timesteps returned by the
                 environments,
         """
-        state, timestep = jax.vmap(self._env.reset)(key)
+        state, timestep = self._vmapped_reset(key)
         return state, timestep
 
     def step(
@@ -337,7 +424,7 @@ class VmapWrapper(Wrapper):
             state: State object corresponding to the next states of the environments,
             timestep: TimeStep object corresponding the timesteps returned by the environments,
         """
-        state, timestep = jax.vmap(self._env.step)(state, action)
+        state, timestep = self._vmapped_step(state, action)
         return state, timestep
 
     def render(self, state: State) -> Any:
@@ -347,7 +434,83 @@ class VmapWrapper(Wrapper):
         Args:
             state: State object containing the current dynamics of the environment.
         """
-        state_0 = tree_utils.tree_slice(state, 0)
+        state_0 = self._slice_first(state)
+        return super().render(state_0)
+
+
+class PmapWrapper(Wrapper):
+    """Jax env parallelized over the local devices.
+    The pmapped `reset` and `step` functions are built once at construction so that repeated
+    calls reuse the same compiled executables.
+    Compose with `VmapWrapper`, e.g. `VmapWrapper(PmapWrapper(env))`, to run
+    `num_envs_per_device * jax.local_device_count()` environments.
+    Please note that all methods that return arrays do not return a device dimension because the
+    device count is not known to the PmapWrapper. Methods that omit the device dimension include:
+    - observation_spec
+    - action_spec
+    - reward_spec
+    - discount_spec
+    """
+
+    def __init__(self, env: Environment):
+        super().__init__(env)
+        self._pmapped_reset = jax.pmap(self._env.reset)
+        self._pmapped_step = jax.pmap(self._env.step)
+        # Jitted slice of the first device's state, so that render does not
+        # walk the state pytree in Python on every frame.
+        self._slice_first = jax.jit(
+            lambda state: jax.tree_util.tree_map(lambda x: x[0], state)
+        )
+
+    def reset(self, key: chex.PRNGKey) -> Tuple[State, TimeStep[Observation]]:
+        """Resets one environment per local device.
+
+        The first dimension of the key must equal `jax.local_device_count()`.
+
+        To obtain a key with the right first dimension, you may call `jax.random.split` on key
+        with the parameter `num` set to `jax.local_device_count()`.
+
+        Args:
+            key: random keys used to reset the environments where the first dimension is the
+                number of local devices.
+
+        Returns:
+            state: State object corresponding to the new state of the environments,
+            timestep: TimeStep object corresponding the first timesteps returned by the
+                environments,
+        """
+        state, timestep = self._pmapped_reset(key)
+        return state, timestep
+
+    def step(
+        self, state: State, action: chex.Array
+    ) -> Tuple[State, TimeStep[Observation]]:
+        """Run one timestep of each device's environment dynamics.
+
+        The first dimension of the state and action must equal `jax.local_device_count()`.
+
+        See `PmapWrapper.reset` for more details on how to get a state of per-device
+        environments.
+
+        Args:
+            state: State object containing the dynamics of the environments.
+            action: Array containing the actions to take.
+
+        Returns:
+            state: State object corresponding to the next states of the environments,
+            timestep: TimeStep object corresponding the timesteps returned by the environments,
+        """
+        state, timestep = self._pmapped_step(state, action)
+        return state, timestep
+
+    def render(self, state: State) -> Any:
+        """Render the environment state of the first device.
+        The remaining elements of the batched state are ignored.
+
+        Args:
+            state: State object containing the current dynamics of the environment.
+        """
+        state_0 = self._slice_first(state)
         return super().render(state_0)
 
 
@@ -510,7 +673,33 @@ class VmapAutoResetWrapper(Wrapper):
         return super().render(state_0)
 
 
-class JumanjiToGymWrapper(gym.Env):
+class _GymConversionMixin:
+    """Numpy conversion helpers shared by the gym wrappers, caching the
+    observation converter and the extras treedef per wrapper instance."""
+
+    def _convert_obs(self, obs: Observation) -> GymObservation:
+        """Convert an observation with a converter specialized on first use for
+        the environment's fixed observation structure."""
+        try:
+            converter = self._obs_converter
+        except AttributeError:
+            converter = self._obs_converter = _make_gym_obs_converter(obs)
+        return converter(obs)
+
+    def _info_from_extras(self, extras: Optional[Dict]) -> Optional[Any]:
+        """Convert the extras pytree to numpy. The structure of extras is fixed
+        for a given environment, so its treedef is computed once and later
+        calls only convert the leaves."""
+        try:
+            treedef = self._extras_treedef
+        except AttributeError:
+            treedef = self._extras_treedef = jax.tree_util.tree_structure(extras)
+        return jax.tree_util.tree_unflatten(
+            treedef, [np.asarray(leaf) for leaf in jax.tree_util.tree_leaves(extras)]
+        )
+
+
+class JumanjiToGymWrapper(_GymConversionMixin, gym.Env):
     """A wrapper that converts a Jumanji `Environment` to one that follows the `gym.Env` API."""
 
     # Flag that prevents `gym.register` from misinterpreting the `_step` and
@@ -528,20 +717,15 @@ class JumanjiToGymWrapper(gym.Env):
         self._env = env
         self.metadata: Dict[str, str] = {}
         self._key = jax.random.PRNGKey(seed)
+        self._refill_key_pool(self._key)
         self.backend = backend
         self._state = None
-        self.observation_space = specs.jumanji_specs_to_gym_spaces(
-            self._env.observation_spec()
-        )
-        self.action_space = specs.jumanji_specs_to_gym_spaces(self._env.action_spec())
 
         def reset(key: chex.PRNGKey) -> Tuple[State, Observation, Optional[Dict]]:
             """Reset function of a Jumanji environment to be jitted."""
             state, timestep = self._env.reset(key)
             return state, timestep.observation, timestep.extras
 
-        self._reset = jax.jit(reset, backend=self.backend)
-
         def step(
             state: State, action: chex.Array
         ) -> Tuple[State, Observation, chex.Array, bool, Optional[Any]]:
@@ -550,7 +734,59 @@ class JumanjiToGymWrapper(gym.Env):
             done = jnp.bool_(timestep.last())
             return state, timestep.observation, timestep.reward, done, timestep.extras
 
-        self._step = jax.jit(step, backend=self.backend)
+        # Compile reset and step ahead of time, so that the first call to
+        # either does not stall on compilation.
+        dummy_key = jax.ShapeDtypeStruct(self._key.shape, self._key.dtype)
+        self._reset = jax.jit(reset, backend=self.backend).lower(dummy_key).compile()
+        state_aval, *_ = jax.eval_shape(reset, dummy_key)
+        action_spec = self._env.action_spec()
+        self._action_dtype = action_spec.dtype
+        dummy_action = jax.ShapeDtypeStruct(action_spec.shape, action_spec.dtype)
+        # The previous state is never used after a step, so its buffers are
+        # donated and reused in place for the returned state.
+        self._step = (
+            jax.jit(step, backend=self.backend, donate_argnums=0)
+            .lower(state_aval, dummy_action)
+            .compile()
+        )
+
+    @property
+    def observation_space(self) -> gym.Space:
+        """Gym space of the observations, built lazily on first access since
+        converting a deeply-nested spec tree is not free and many users never
+        inspect the space before stepping."""
+        try:
+            return self.__dict__["_observation_space"]
+        except KeyError:
+            observation_space: gym.Space = specs.jumanji_specs_to_gym_spaces(
+                self._env.observation_spec()
+            )
+            self.__dict__["_observation_space"] = observation_space
+            return observation_space
+
+    @property
+    def action_space(self) -> gym.Space:
+        """Gym space of the actions, built lazily on first access."""
+        try:
+            return self.__dict__["_action_space"]
+        except KeyError:
+            action_space: gym.Space = specs.jumanji_specs_to_gym_spaces(
+                self._env.action_spec()
+            )
+            self.__dict__["_action_space"] = action_space
+            return action_space
+
+    def _refill_key_pool(self, key: chex.PRNGKey) -> None:
+        # The last key of the pool is reserved for the next refill.
+        self._key_pool = jax.random.split(key, _RESET_KEY_POOL_SIZE + 1)
+        self._key_idx = 0
+
+    def _next_reset_key(self) -> chex.PRNGKey:
+        if self._key_idx == _RESET_KEY_POOL_SIZE:
+            self._refill_key_pool(self._key_pool[-1])
+        reset_key = self._key_pool[self._key_idx]
+        self._key_idx += 1
+        return reset_key
 
     def reset(
         self,
@@ -568,21 +804,46 @@ class JumanjiToGymWrapper(gym.Env):
         """
         if seed is not None:
             self.seed(seed)
-        key, self._key = jax.random.split(self._key)
-        self._state, obs, extras = self._reset(key)
+        self._state, obs, extras = self._reset(self._next_reset_key())
 
         # Convert the observation to a numpy array or a nested dict thereof
-        obs = jumanji_to_gym_obs(obs)
+        obs = self._convert_obs(obs)
 
         if return_info:
-            info = jax.tree_util.tree_map(np.asarray, extras)
+            info = self._info_from_extras(extras)
             return obs, info
         else:
             return obs  # type: ignore
 
+    def step_async(self, action: chex.ArrayNumpy) -> None:
+        """Dispatches the jitted step without waiting for its results, so the
+        caller can overlap action selection with the environment computation.
+
+        Args:
+            action: A NumPy array representing the action provided by the agent.
+        """
+        # Cast to the action spec's dtype with numpy: the compiled step takes
+        # numpy arrays directly, so no device buffer is built in Python here.
+        action = np.asarray(action, self._action_dtype)
+        self._step_outputs = self._step(self._state, action)
+
+    def step_wait(self) -> Tuple[GymObservation, chex.ArrayNumpy, bool, Optional[Any]]:
+        """Waits for the step dispatched by `step_async` and returns its results."""
+        self._state, obs, reward, done, extras = self._step_outputs
+
+        # Convert to get the correct signature. Returning the reward as a 0-d
+        # numpy array keeps the device-to-host synchronization here rather
+        # than adding a blocking float() conversion.
+        obs = self._convert_obs(obs)
+        reward = np.asarray(reward)
+        terminated = bool(done)
+        info = self._info_from_extras(extras)
+
+        return obs, reward, terminated, info
+
     def step(
         self, action: chex.ArrayNumpy
-    ) -> Tuple[GymObservation, float, bool, Optional[Any]]:
+    ) -> Tuple[GymObservation, chex.ArrayNumpy, bool, Optional[Any]]:
         """Updates the environment according to the action and returns an `Observation`.
 
         Args:
@@ -590,24 +851,162 @@ class JumanjiToGymWrapper(gym.Env):
 
         Returns:
             observation: an element of the environment's observation_space.
-            reward: the amount of reward returned as a result of taking the action.
+            reward: the amount of reward returned as a result of taking the action,
+                as a 0-d numpy array.
             terminated: whether a terminal state is reached.
             info: contains supplementary information such as metrics.
         """
+        self.step_async(action)
+        return self.step_wait()
+
+    def seed(self, seed: int = 0) -> None:
+        """Function which sets the seed for the environment's random number generator(s).
+
+        Args:
+            seed: the seed value for the random number generator(s).
+        """
+        self._key = jax.random.PRNGKey(seed)
+        self._refill_key_pool(self._key)
+
+    def render(self, mode: str = "human") -> Any:
+        """Renders the environment.
+
+        Args:
+            mode: currently not used since Jumanji does not currently support modes.
+        """
+        del mode
+        return self._env.render(self._state)
+
+    def close(self) -> None:
+        """Closes the environment, important for rendering where pygame is imported."""
+        self._env.close()
+
+    @property
+    def unwrapped(self) -> Environment:
+        return self._env
+
+
+class JumanjiToGymVectorWrapper(_GymConversionMixin, gym.vector.VectorEnv):
+    """A wrapper that converts a Jumanji `Environment` to a `gym.vector.VectorEnv`
+    stepping a batch of environments in a single jitted call.
+
+    The environment is wrapped in a `VmapAutoResetWrapper` before being jitted,
+    so stepping, conditional resetting of terminated environments and batching
+    all happen inside one compiled graph - the per-call Python and dispatch
+    overhead is paid once for the whole batch rather than once per environment.
+    """
+
+    # Flag that prevents `gym.register` from misinterpreting the `_step` and
+    # `_reset` as signs of a deprecated gym Env API.
+    _gym_disable_underscore_compat: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        env: Environment,
+        num_envs: int,
+        seed: int = 0,
+        backend: Optional[str] = None,
+    ):
+        """Create a vectorized Gym environment.
+
+        Args:
+            env: `Environment` to wrap to a `gym.vector.VectorEnv`.
+            num_envs: number of environments to step in parallel.
+            seed: the seed that is used to initialize the environments' PRNG.
+            backend: the XLA backend.
+        """
+        self._env = VmapAutoResetWrapper(env)
+        self.metadata: Dict[str, str] = {}
+        self._key = jax.random.PRNGKey(seed)
+        self.backend = backend
+        self._state = None
+        super().__init__(
+            num_envs,
+            specs.jumanji_specs_to_gym_spaces(env.observation_spec()),
+            specs.jumanji_specs_to_gym_spaces(env.action_spec()),
+        )
+
+        def reset(key: chex.PRNGKey) -> Tuple[State, Observation, Optional[Dict]]:
+            """Reset function of a batch of Jumanji environments to be jitted."""
+            keys = jax.random.split(key, num_envs)
+            state, timestep = self._env.reset(keys)
+            return state, timestep.observation, timestep.extras
+
+        self._reset = jax.jit(reset, backend=self.backend)
+
+        def step(
+            state: State, action: chex.Array
+        ) -> Tuple[State, Observation, chex.Array, chex.Array, Optional[Any]]:
+            """Step function of a batch of Jumanji environments to be jitted."""
+            state, timestep = self._env.step(state, action)
+            return (
+                state,
+                timestep.observation,
+                timestep.reward,
+                timestep.last(),
+                timestep.extras,
+            )
+
+        self._step = jax.jit(step, backend=self.backend)
+
+    def reset(
+        self,
+        *,
+        seed: Optional[int] = None,
+        return_info: bool = False,
+        options: Optional[dict] = None,
+    ) -> Union[GymObservation, Tuple[GymObservation, Optional[Any]]]:
+        """Resets all environments to initial states and returns the batch of
+        first `Observation`s.
+
+        Returns:
+            obs: an element of the environment's batched observation_space.
+            info (optional): contains supplementary information such as metrics.
+        """
+        if seed is not None:
+            self.seed(seed)
+        key, self._key = jax.random.split(self._key)
+        self._state, obs, extras = self._reset(key)
 
-        action = jnp.array(action)  # Convert input numpy array to JAX array
-        self._state, obs, reward, done, extras = self._step(self._state, action)
+        # Convert the observation to a numpy array or a nested dict thereof
+        obs = self._convert_obs(obs)
+
+        if return_info:
+            info = self._info_from_extras(extras)
+            return obs, info
+        else:
+            return obs  # type: ignore
+
+    def step(
+        self, actions: chex.ArrayNumpy
+    ) -> Tuple[GymObservation, chex.ArrayNumpy, chex.ArrayNumpy, Optional[Any]]:
+        """Updates all environments according to the batch of actions. Environments
+        whose episode terminates are automatically reset within the jitted step.
+
+        Args:
+            actions: A NumPy array of shape (num_envs, ...) with the action for
+                each environment.
+
+        Returns:
+            observation: an element of the environment's batched observation_space.
+            reward: array of rewards of shape (num_envs,).
+            terminated: boolean array of shape (num_envs,) flagging which
+                environments reached a terminal state on this step.
+            info: contains supplementary information such as metrics.
+        """
+        actions = jnp.asarray(actions)  # Convert input numpy array to JAX array
+        self._state, obs, reward, done, extras = self._step(self._state, actions)
 
         # Convert to get the correct signature
-        obs = jumanji_to_gym_obs(obs)
-        reward = float(reward)
-        terminated = bool(done)
-        info = jax.tree_util.tree_map(np.asarray, extras)
+        obs = self._convert_obs(obs)
+        reward = np.asarray(reward)
+        terminated = np.asarray(done)
+        info = self._info_from_extras(extras)
 
         return obs, reward, terminated, info
 
     def seed(self, seed: int = 0) -> None:
-        """Function which sets the seed for the environment's random number generator(s).
+        """Function which sets the seed for the environments' random number generator(s).
 
         Args:
             seed: the seed value for the random number generator(s).
@@ -615,7 +1014,7 @@ class JumanjiToGymWrapper(gym.Env):
         self._key = jax.random.PRNGKey(seed)
 
     def render(self, mode: str = "human") -> Any:
-        """Renders the environment.
+        """Renders the first environment of the batch.
 
         Args:
             mode: currently not used since Jumanji does not currently support modes.
@@ -629,12 +1028,17 @@ class JumanjiToGymWrapper(gym.Env):
 
     @property
     def unwrapped(self) -> Environment:
-        return self._env
+        return self._env.unwrapped
 
 
 def jumanji_to_gym_obs(observation: Observation) -> GymObservation:
     """Convert a Jumanji observation into a gym observation.
 
+    The dictionary structure is computed once per observation treedef and
+    cached, so that repeated calls - one per environment step - only do a
+    C-level flatten and the per-leaf numpy conversions instead of a recursive
+    Python walk over the whole tree.
+
     Args:
         observation: JAX pytree with (possibly nested) containers that
             either have the `__dict__` or `_asdict` methods implemented.
@@ -642,9 +1046,20 @@ def jumanji_to_gym_obs(observation: Observation) -> GymObservation:
     Returns:
         Numpy array or nested dictionary of numpy arrays.
     """
+    # Most environments emit a plain array observation: convert it straight
+    # away without flattening anything.
     if isinstance(observation, chex.Array):
         return np.asarray(observation)
-    elif hasattr(observation, "__dict__"):
+    leaves, treedef = jax.tree_util.tree_flatten(observation)
+    if all(isinstance(leaf, chex.Array) for leaf in leaves):
+        try:
+            rebuild = _gym_obs_rebuilders[treedef]
+        except KeyError:
+            rebuild = _gym_obs_rebuilders[treedef] = _make_gym_obs_rebuilder(treedef)
+        return rebuild([np.asarray(leaf) for leaf in leaves])
+    # Containers that are not registered pytree nodes appear as leaves above:
+    # fall back to walking them recursively.
+    if hasattr(observation, "__dict__"):
         # Applies to various containers including `chex.dataclass`
         return {
             key: jumanji_to_gym_obs(value) for key, value in vars(observation).items()
@@ -660,3 +1075,70 @@ def jumanji_to_gym_obs(observation: Observation) -> GymObservation:
             "Conversion only implemented for JAX pytrees with (possibly nested) containers "
             "that either have the `__dict__` or `_asdict` methods implemented."
         )
+
+
+class _Slot:
+    """Placeholder leaf marking where a converted array goes in the template."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+
+_gym_obs_rebuilders: Dict[Any, Callable[[list], GymObservation]] = {}
+
+
+def _make_gym_obs_converter(
+    observation: Observation,
+) -> Callable[[Observation], GymObservation]:
+    """Specialize `jumanji_to_gym_obs` for a fixed observation structure.
+
+    The returned closure assumes every observation it receives has the same
+    structure as the example it was built from, so the hot path is only a
+    C-level flatten and the per-leaf numpy conversions — no type checks.
+    """
+    if isinstance(observation, chex.Array):
+        return np.asarray
+    leaves, treedef = jax.tree_util.tree_flatten(observation)
+    if all(isinstance(leaf, chex.Array) for leaf in leaves):
+        rebuild = _make_gym_obs_rebuilder(treedef)
+
+        def convert(obs: Observation) -> GymObservation:
+            return rebuild(
+                [np.asarray(leaf) for leaf in jax.tree_util.tree_leaves(obs)]
+            )
+
+        return convert
+    # Containers that are not registered pytree nodes: no specialization, walk
+    # the tree on every call.
+    return jumanji_to_gym_obs
+
+
+def _make_gym_obs_rebuilder(treedef: Any) -> Callable[[list], GymObservation]:
+    """Build a function mapping a flat list of numpy leaves to the nested gym
+    dictionary for the given observation structure."""
+    slots = [_Slot(index) for index in range(treedef.num_leaves)]
+
+    def to_template(node: Any) -> Any:
+        if isinstance(node, _Slot):
+            return node.index
+        elif hasattr(node, "__dict__"):
+            return {key: to_template(value) for key, value in vars(node).items()}
+        elif hasattr(node, "_asdict"):
+            return {key: to_template(value) for key, value in node._asdict().items()}
+        else:
+            raise NotImplementedError(
+                "Conversion only implemented for JAX pytrees with (possibly nested) "
+                "containers that either have the `__dict__` or `_asdict` methods "
+                "implemented."
+            )
+
+    template = to_template(jax.tree_util.tree_unflatten(treedef, slots))
+
+    def fill(node: Any, leaves: list) -> GymObservation:
+        if isinstance(node, dict):
+            return {key: fill(value, leaves) for key, value in node.items()}
+        return leaves[node]
+
+    return lambda leaves: fill(template, leaves)
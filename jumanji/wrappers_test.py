@@ -34,8 +34,10 @@ from jumanji.types import StepType, TimeStep
 from jumanji.wrappers import (
     AutoResetWrapper,
     JumanjiToDMEnvWrapper,
+    JumanjiToGymVectorWrapper,
     JumanjiToGymWrapper,
     MultiToSingleWrapper,
+    PmapWrapper,
     VmapAutoResetWrapper,
     VmapWrapper,
     Wrapper,
@@ -141,6 +143,18 @@ class TestBaseWrapper:
 
         mock_action_spec.assert_called_once()
 
+    def test_wrapper__getattr(
+        self, wrapped_fake_environment: Wrapper, fake_environment: FakeEnvironment
+    ) -> None:
+        """Checks `Wrapper.__getattr__` delegates to the underlying env without
+        shadowing the wrapper's own lazily-cached attributes."""
+        assert wrapped_fake_environment.time_limit == fake_environment.time_limit
+        # Accessing an underscore attribute of the wrapped env must not poison
+        # the wrapper's spec cache.
+        fake_environment._observation_spec = None
+        assert wrapped_fake_environment._observation_spec is None
+        assert isinstance(wrapped_fake_environment.observation_spec(), specs.Array)
+
     def test_wrapper__repr(self, wrapped_fake_environment: Wrapper) -> None:
         """Checks `Wrapper.__repr__` returns the expected representation string."""
         repr_str = repr(wrapped_fake_environment)
@@ -282,7 +296,9 @@ class TestJumanjiEnvironmentToGymEnv:
         action = fake_gym_env.action_space.sample()
         next_observation, reward, terminated, info = fake_gym_env.step(action)  # type: ignore
         assert_trees_are_different(observation, next_observation)
-        assert isinstance(reward, float)
+        # The reward is returned as a 0-d numpy array to avoid a blocking
+        # float conversion in the step hot path.
+        assert np.ndim(reward) == 0
         assert isinstance(terminated, bool)
 
     def test_jumanji_environment_to_gym_env__observation_space(
@@ -331,6 +347,93 @@ class TestJumanjiEnvironmentToGymEnv:
         assert isinstance(fake_gym_env.unwrapped, Environment)
 
 
+class TestJumanjiEnvironmentToGymVectorEnv:
+    """
+    Test the JumanjiToGymVectorWrapper that transforms an Environment into a
+    gym.vector.VectorEnv format.
+    """
+
+    num_envs = 3
+
+    @pytest.fixture
+    def fake_gym_vector_env(self, time_limit: int = 10) -> JumanjiToGymVectorWrapper:
+        """Creates a fake environment wrapped as a gym.vector.VectorEnv."""
+        return JumanjiToGymVectorWrapper(
+            FakeEnvironment(time_limit=time_limit), num_envs=self.num_envs
+        )
+
+    def test_jumanji_environment_to_gym_vector_env__init(
+        self, fake_environment: FakeEnvironment
+    ) -> None:
+        """Validates initialization of the gym vector wrapper."""
+        gym_environment = JumanjiToGymVectorWrapper(fake_environment, num_envs=2)
+        assert isinstance(gym_environment, gym.vector.VectorEnv)
+        assert gym_environment.num_envs == 2
+
+    def test_jumanji_environment_to_gym_vector_env__reset(
+        self, fake_gym_vector_env: JumanjiToGymVectorWrapper
+    ) -> None:
+        """Validates reset function of the wrapped environment."""
+        observation1 = fake_gym_vector_env.reset()  # type: ignore
+        state1 = fake_gym_vector_env._state
+        observation2 = fake_gym_vector_env.reset()  # type: ignore
+        state2 = fake_gym_vector_env._state
+
+        assert isinstance(observation1, chex.ArrayNumpy)
+        assert observation1.shape == (self.num_envs,)
+
+        # Check that the observations are equal
+        chex.assert_trees_all_equal(observation1, observation2)
+        assert_trees_are_different(state1, state2)
+
+    def test_jumanji_environment_to_gym_vector_env__step(
+        self, fake_gym_vector_env: JumanjiToGymVectorWrapper
+    ) -> None:
+        """Validates step function of the wrapped environment."""
+        observation = fake_gym_vector_env.reset()  # type: ignore
+        actions = fake_gym_vector_env.action_space.sample()
+        next_observation, reward, terminated, info = fake_gym_vector_env.step(actions)
+        assert_trees_are_different(observation, next_observation)
+        assert reward.shape == (self.num_envs,)
+        assert terminated.shape == (self.num_envs,)
+        assert terminated.dtype == bool
+
+    def test_jumanji_environment_to_gym_vector_env__auto_reset(
+        self, fake_gym_vector_env: JumanjiToGymVectorWrapper, time_limit: int = 10
+    ) -> None:
+        """Validates that terminated environments are reset within the jitted step."""
+        observation = fake_gym_vector_env.reset()  # type: ignore
+        actions = fake_gym_vector_env.action_space.sample()
+        for _ in range(time_limit):
+            observation, _, terminated, _ = fake_gym_vector_env.step(actions)
+        assert terminated.all()
+        # The batch of observations has been reset to initial observations.
+        initial_observation = fake_gym_vector_env.reset()  # type: ignore
+        chex.assert_trees_all_equal(observation, initial_observation)
+
+    def test_jumanji_environment_to_gym_vector_env__observation_space(
+        self, fake_gym_vector_env: JumanjiToGymVectorWrapper
+    ) -> None:
+        """Validates observation_space attribute of the wrapped environment."""
+        assert isinstance(fake_gym_vector_env.observation_space, gym.spaces.Space)
+        assert isinstance(
+            fake_gym_vector_env.single_observation_space, gym.spaces.Space
+        )
+
+    def test_jumanji_environment_to_gym_vector_env__action_space(
+        self, fake_gym_vector_env: JumanjiToGymVectorWrapper
+    ) -> None:
+        """Validates action_space attribute of the wrapped environment."""
+        assert isinstance(fake_gym_vector_env.action_space, gym.spaces.Space)
+        assert isinstance(fake_gym_vector_env.single_action_space, gym.spaces.Space)
+
+    def test_jumanji_environment_to_gym_vector_env__unwrapped(
+        self, fake_gym_vector_env: JumanjiToGymVectorWrapper
+    ) -> None:
+        """Validates unwrapped property of the wrapped environment."""
+        assert isinstance(fake_gym_vector_env.unwrapped, Environment)
+
+
 class TestMultiToSingleEnvironment:
     @pytest.fixture
     def fake_multi_to_single_env(
@@ -505,6 +608,71 @@ class TestVmapWrapper:
         assert fake_vmap_environment._env is fake_environment
 
 
+class TestPmapWrapper:
+    @pytest.fixture
+    def fake_pmap_environment(self, fake_environment: FakeEnvironment) -> PmapWrapper:
+        return PmapWrapper(fake_environment)
+
+    @pytest.fixture
+    def device_keys(self, key: chex.PRNGKey) -> chex.PRNGKey:
+        return jax.random.split(key, num=jax.local_device_count())
+
+    def test_pmap_wrapper__init(self, fake_environment: FakeEnvironment) -> None:
+        """Validates initialization of the pmap wrapper."""
+        pmap_env = PmapWrapper(fake_environment)
+        assert isinstance(pmap_env, Environment)
+
+    def test_pmap_env__reset(
+        self, fake_pmap_environment: PmapWrapper, device_keys: chex.PRNGKey
+    ) -> None:
+        """Validates reset function and timestep type of the pmap wrapped environment."""
+        _, timestep = fake_pmap_environment.reset(device_keys)
+
+        assert isinstance(timestep, TimeStep)
+        chex.assert_trees_all_equal(timestep.step_type, StepType.FIRST)
+        assert timestep.observation.shape[0] == device_keys.shape[0]
+        assert timestep.reward.shape == (device_keys.shape[0],)
+        assert timestep.discount.shape == (device_keys.shape[0],)
+
+    def test_pmap_env__step(
+        self, fake_pmap_environment: PmapWrapper, device_keys: chex.PRNGKey
+    ) -> None:
+        """Validates step function of the pmap environment."""
+        state, timestep = fake_pmap_environment.reset(
+            device_keys
+        )  # type: Tuple[FakeState, TimeStep]
+        action = jax.vmap(
+            lambda _: fake_pmap_environment.action_spec().generate_value()
+        )(device_keys)
+
+        state, next_timestep = fake_pmap_environment.step(
+            state, action
+        )  # type: Tuple[FakeState, TimeStep]
+
+        assert_trees_are_different(next_timestep, timestep)
+        chex.assert_trees_all_equal(next_timestep.reward, 0)
+
+        assert next_timestep.reward.shape == (device_keys.shape[0],)
+        assert next_timestep.discount.shape == (device_keys.shape[0],)
+        assert next_timestep.observation.shape[0] == device_keys.shape[0]
+
+    def test_pmap_env__render(
+        self, fake_pmap_environment: PmapWrapper, device_keys: chex.PRNGKey
+    ) -> None:
+        states, _ = fake_pmap_environment.reset(
+            device_keys
+        )  # type: Tuple[FakeState, TimeStep]
+        result = fake_pmap_environment.render(states)
+        assert result == (device_keys.shape[1:], ())
+
+    def test_pmap_env__unwrapped(
+        self, fake_environment: Environment, fake_pmap_environment: PmapWrapper
+    ) -> None:
+        """Validates unwrapped property of the pmap environment."""
+        assert isinstance(fake_pmap_environment.unwrapped, Environment)
+        assert fake_pmap_environment._env is fake_environment
+
+
 class TestAutoResetWrapper:
     @pytest.fixture
     def fake_auto_reset_environment(